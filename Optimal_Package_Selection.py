@@ -1,5 +1,9 @@
 import streamlit as st
 
+from knapsack_solver import SolveMetrics, cached_solve, solve_fleet, solve_multidim
+from knapsack_solver.io import read_items
+from solver_ui import MAX_LISTED_ITEMS, show_metrics, solve_outcome, start_solve, time_limit_input
+
 # Page configuration
 st.set_page_config(page_title="Optimal Package Selection", page_icon="📦", layout="centered")
 
@@ -33,57 +37,62 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def knapsack(values, weights, capacity):
-    n = len(values)
-    
-    # DP table
-    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
-
-    # Fill DP table
-    for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
-            if weights[i - 1] <= w:
-                dp[i][w] = max(values[i - 1] + dp[i - 1][w - weights[i - 1]], 
-                               dp[i - 1][w])
-            else:
-                dp[i][w] = dp[i - 1][w]
-
-    # Backtrack to find selected items
-    res = dp[n][capacity]
-    w = capacity
-    chosen_items = []
-    
-    for i in range(n, 0, -1):
-        if res <= 0:
-            break
-        if res == dp[i - 1][w]:
-            continue
-        else:
-            chosen_items.append(i - 1)
-            res -= values[i - 1]
-            w -= weights[i - 1]
-
-    chosen_items.reverse()
+def knapsack(values, weights, capacity, volumes=None, volume_capacity=None, control=None, cache=None,
+             metrics=None):
+    if volumes is None:
+        result = cached_solve(values, weights, capacity, cache=cache, control=control, metrics=metrics)
+    else:
+        result = solve_multidim(values, list(zip(weights, volumes)), (capacity, volume_capacity),
+                                control=control, metrics=metrics)
+    chosen_items = list(result.chosen)
 
     # Manager-style descriptive output
     if chosen_items:
         items_desc = []
-        for i in chosen_items:
-            items_desc.append(f"a package worth {values[i]} units with weight {weights[i]}")
+        for i in chosen_items[:MAX_LISTED_ITEMS]:
+            volume_text = f" and volume {volumes[i]}" if volumes is not None else ""
+            items_desc.append(f"a package worth {values[i]} units with weight {weights[i]}{volume_text}")
+        if len(chosen_items) > MAX_LISTED_ITEMS:
+            items_desc.append(f"{len(chosen_items) - MAX_LISTED_ITEMS} more packages")
         
         if len(items_desc) > 1:
             items_text = ", ".join(items_desc[:-1]) + f", and {items_desc[-1]}"
         else:
             items_text = items_desc[0]
         
+        if volumes is not None:
+            capacity = f"{capacity} (volume limit {volume_capacity})"
         return (f"📦 After evaluating the available packages and the vehicle's capacity of {capacity}, "
-                f"the most valuable loading plan will give us a total declared value of 💰 {dp[n][capacity]}. "
+                f"the most valuable loading plan will give us a total declared value of 💰 {result.total_value}. "
                 f"This can be achieved by selecting {items_text}.")
     else:
         return (f"⚠️ Given the vehicle's capacity of {capacity}, no combination of packages "
                 f"can provide a positive declared value.")
 
 
+def fleet_loading(values, weights, capacities, control=None, metrics=None):
+    # The page's time limit stops the search, which then returns its best plan
+    result = solve_fleet(values, weights, capacities, control=control, metrics=metrics)
+
+    manifest = []
+    for k, items in enumerate(result.assignments):
+        manifest.append({
+            "Vehicle": f"🚚 Vehicle {k + 1}",
+            "Capacity": capacities[k],
+            "Load": result.loads[k],
+            "Value": sum(values[i] for i in items),
+            "Packages": ", ".join(f"#{i + 1}" for i in items) or "—",
+        })
+
+    if result.optimal:
+        value_text = f"the most valuable loading plan gives a total declared value of 💰 {result.total_value}"
+    else:
+        value_text = (f"the best loading plan found within the time limit gives a total declared "
+                      f"value of 💰 {result.total_value} (at most {result.upper_bound} is possible)")
+    return (f"📦 After evaluating the available packages across a fleet of {len(capacities)} vehicles, "
+            f"{value_text}. Each package is loaded onto at most one vehicle, as listed below."), manifest
+
+
 # ---- App Title ----
 st.title("📦 Optimal Package Selection for Shipping")
 st.write("Use this tool to determine the **best combination of packages** to maximize value within your vehicle's capacity.")
@@ -98,20 +107,64 @@ with col1:
 with col2:
     weight = st.text_input("Enter weights of packages (space separated)", placeholder="e.g. 10 20 30")
 
-capacity = st.text_input("Enter vehicle capacity", placeholder="e.g. 50")
+capacity = st.text_input("Enter vehicle capacity (several space separated capacities to load a fleet)",
+                         placeholder="e.g. 50  or  50 40 30")
+
+col3, col4 = st.columns(2)
+with col3:
+    volume = st.text_input("Enter volumes of packages (optional, space separated)", placeholder="e.g. 4 2 6")
+with col4:
+    volume_capacity = st.text_input("Enter vehicle volume capacity (optional)", placeholder="e.g. 8")
+
+upload = st.file_uploader("📂 Or upload the packages as a CSV, Parquet or NPY file "
+                          "(columns: value, weight, optional volume)", type=["csv", "parquet", "npy"])
+
+time_limit = time_limit_input("package")
 
 
 # ---- Button ----
 if st.button("🚀 Get the Best Combination"):
-    val = [int(i) for i in value.split()]
-    wt = [int(w) for w in weight.split()]
-    cap = int(capacity.split()[0])
+    metrics = SolveMetrics()
+    with metrics.timer("parse"):
+        if upload is not None:
+            try:
+                items = read_items(upload, ["value", "weight"], optional=["volume"], nonnegative=["weight", "volume"])
+            except ValueError as exc:
+                st.error(f"Could not read {upload.name}: {exc}")
+                st.stop()
+            val, wt, vol = items["value"], items["weight"], items.get("volume")
+        else:
+            val = [int(i) for i in value.split()]
+            wt = [int(w) for w in weight.split()]
+            vol = [int(v) for v in volume.split()] or None
+        caps = [int(c) for c in capacity.split()]
+
+        vol_cap = int(volume_capacity.split()[0]) if volume_capacity.split() else None
+
+        if vol is not None and (vol_cap is None or len(caps) > 1):
+            st.error("Volume limits need a single vehicle capacity and a volume capacity.")
+            st.stop()
+
+    def run(control, cache):
+        if len(caps) > 1:
+            return fleet_loading(val, wt, caps, control=control, metrics=metrics)
+        return knapsack(val, wt, caps[0], vol, vol_cap, control=control, cache=cache, metrics=metrics), None
+
+    # Solve in the background so the page stays responsive and can be cancelled
+    start_solve("package", run, time_limit, val, wt, caps, vol, vol_cap, metrics=metrics)
+
 
-    # Get result
-    result_text = knapsack(val, wt, cap)
+# ---- Result ----
+outcome = solve_outcome("package")
+if outcome is not None:
+    result_text, manifest = outcome
 
-    # Styled result box (all-in-one)
-    st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
+    with show_metrics("package"):
+        # Styled result box (all-in-one)
+        st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
+        if manifest:
+            st.subheader("🚚 Per-Vehicle Manifest")
+            st.table(manifest)
 
     # Full Code Section
     st.subheader("📝 Full Code Implementation")
@@ -0,0 +1,205 @@
+"""UI-free knapsack solvers shared by the Streamlit pages and batch jobs."""
+
+import inspect
+
+from .approx import solve_fptas, solve_greedy
+from .bounded import UNLIMITED, binary_split, solve_bounded
+from .branch_and_bound import fractional_bound, solve_branch_and_bound
+from .cache import SolveCache, default_cache, instance_key
+from .control import SolveCancelled, SolveControl, SolveTimeout
+from .dp import solve_dp
+from .incremental import IncrementalKnapsack
+from .jit import numba_available, solve_numba
+from .metrics import PHASES, SolveMetrics, phase
+from .multichoice import solve_multiple_choice
+from .multidim import solve_multidim
+from .multiple import solve_fleet, solve_fleet_greedy
+from .outofcore import MEMORY_BUDGET, solve_memmap
+from .parallel import solve_parallel
+from .pareto import solve_pareto
+from .precedence import solve_prerequisites
+from .preprocess import Reduction, reduce_instance
+from .profile import CapacityProfile, profile_values, solve_profile
+from .result import FleetResult, KnapsackResult
+from .topk import solve_top_k
+from .value_dp import solve_by_value, value_axis_size
+from .vectorized import PACKED_CELL_THRESHOLD, keep_table_bytes, solve_bitset, solve_numpy
+
+SOLVERS = {
+    "dp": solve_dp,
+    "numpy": solve_numpy,
+    "numba": solve_numba,
+    "bitset": solve_bitset,
+    "parallel": solve_parallel,
+    "memmap": solve_memmap,
+    "value": solve_by_value,
+    "branch_and_bound": solve_branch_and_bound,
+    "fptas": solve_fptas,
+    "greedy": solve_greedy,
+    "pareto": solve_pareto,
+}
+
+# Modes that may trade optimality for speed; "auto" never picks these.
+APPROXIMATE_METHODS = ("fptas", "greedy")
+
+# Beyond this many DP cells on the shorter axis no table-based mode is
+# practical and ``solve(method="auto")`` falls back to branch and bound.
+DP_CELL_LIMIT = 4 * 10**9
+
+
+def choose_method(values, weights, capacity, memory_budget=None):
+    """Pick the exact solver mode ``solve(method="auto")`` would use.
+
+    The DP runs over whichever axis is shorter: capacity, or the total
+    value of the items that fit. Weight-indexed tables use the compiled
+    kernel when Numba is installed, and go to disk when even the
+    bit-packed table would exceed ``memory_budget`` bytes (default
+    :data:`MEMORY_BUDGET`). The value-indexed mode checks its own table
+    against the same budget and moves it to disk itself.
+    """
+    if memory_budget is None:
+        memory_budget = MEMORY_BUDGET
+    capacity = int(capacity)
+    value_axis = value_axis_size(values, weights, capacity)
+    if len(values) * (min(value_axis, capacity) + 1) > DP_CELL_LIMIT:
+        return "branch_and_bound"
+    if value_axis < capacity:
+        return "value"
+    if keep_table_bytes(len(values), capacity, packed=True) > memory_budget:
+        return "memmap"
+    if numba_available():
+        return "numba"
+    if len(values) * (capacity + 1) > PACKED_CELL_THRESHOLD:
+        return "bitset"
+    return "numpy"
+
+
+def _solver_options(solver, options, drop_unknown):
+    # Modes without a time_limit of their own get it as a SolveControl deadline
+    accepted = inspect.signature(solver).parameters
+    options = dict(options)
+    if "time_limit" in options and "time_limit" not in accepted:
+        time_limit = options.pop("time_limit")
+        if time_limit is not None and options.get("control") is None:
+            options["control"] = SolveControl(time_limit)
+    if drop_unknown:
+        options = {name: value for name, value in options.items() if name in accepted}
+    return options
+
+
+def solve(values, weights, capacity, method="auto", preprocess=True, metrics=None, **options):
+    """Solve a 0/1 knapsack instance and return a :class:`KnapsackResult`.
+
+    ``method`` is one of the keys of :data:`SOLVERS`, or ``"auto"`` to let
+    the engine pick the fastest exact mode for the instance. Unless
+    ``preprocess`` is false the instance first goes through
+    :func:`reduce_instance`. Extra keyword ``options`` such as
+    ``time_limit`` are passed through to the solver. Modes without a
+    ``time_limit`` parameter get it as a :class:`SolveControl` and raise
+    :class:`SolveTimeout` when it runs out. With ``"auto"`` an option the
+    picked mode does not take is dropped, so ``time_limit`` or
+    ``memory_budget`` can be passed whichever mode is picked;
+    ``memory_budget`` also decides when ``"auto"`` goes to disk. Pass a
+    :class:`SolveMetrics` as ``metrics`` to have every phase measured.
+    """
+    if method != "auto" and method not in SOLVERS:
+        raise ValueError(f"unknown solver method {method!r}; expected one of {sorted(SOLVERS)}")
+    auto = method == "auto"
+    if not preprocess:
+        if auto:
+            method = choose_method(values, weights, capacity, options.get("memory_budget"))
+        options = _solver_options(SOLVERS[method], options, drop_unknown=auto)
+        return SOLVERS[method](values, weights, capacity, metrics=metrics, **options)
+
+    with phase(metrics, "preprocess", len(values)):
+        reduction = reduce_instance(values, weights, capacity)
+        if auto:
+            method = choose_method(reduction.values, reduction.weights, reduction.capacity,
+                                   options.get("memory_budget"))
+    options = _solver_options(SOLVERS[method], options, drop_unknown=auto)
+    reduced = SOLVERS[method](reduction.values, reduction.weights, reduction.capacity, metrics=metrics, **options)
+    with phase(metrics, "preprocess"):
+        return reduction.expand(reduced, values, weights)
+
+
+def cached_solve(values, weights, capacity, method="auto", cache=None, **options):
+    """Like :func:`solve`, but repeated instances are answered from an LRU cache.
+
+    ``cache`` defaults to :data:`default_cache`, which is shared by every
+    caller in the process. The ``control`` and ``metrics`` options are
+    passed to the solver but are not part of the cache key; ``metrics``
+    also counts the cache hit or miss. A ``time_limit`` is handled as a
+    :class:`SolveControl` and is not part of the key either. A result
+    that is not optimal while its control has stopped came from a search
+    cut short, so it is not cached and a later call with more time solves
+    again; approximate results are cached like any other.
+    """
+    if cache is None:
+        cache = default_cache
+    control = options.pop("control", None)
+    metrics = options.pop("metrics", None)
+    time_limit = options.pop("time_limit", None)
+    if control is None and time_limit is not None:
+        control = SolveControl(time_limit)
+    key = instance_key(values, weights, capacity, method, **options)
+    result = cache.get(key)
+    if metrics is not None:
+        if result is None:
+            metrics.cache_misses += 1
+        else:
+            metrics.cache_hits += 1
+    if result is None:
+        result = solve(values, weights, capacity, method=method, control=control, metrics=metrics, **options)
+        stopped_early = not result.optimal and control is not None and control.should_stop()
+        if not stopped_early:
+            cache.put(key, result)
+    return result
+
+
+__all__ = [
+    "APPROXIMATE_METHODS",
+    "CapacityProfile",
+    "DP_CELL_LIMIT",
+    "FleetResult",
+    "IncrementalKnapsack",
+    "PHASES",
+    "SOLVERS",
+    "KnapsackResult",
+    "MEMORY_BUDGET",
+    "Reduction",
+    "SolveCache",
+    "SolveCancelled",
+    "SolveControl",
+    "SolveMetrics",
+    "SolveTimeout",
+    "UNLIMITED",
+    "binary_split",
+    "cached_solve",
+    "choose_method",
+    "default_cache",
+    "fractional_bound",
+    "instance_key",
+    "numba_available",
+    "profile_values",
+    "reduce_instance",
+    "solve",
+    "solve_branch_and_bound",
+    "solve_bitset",
+    "solve_bounded",
+    "solve_by_value",
+    "solve_dp",
+    "solve_fleet",
+    "solve_fleet_greedy",
+    "solve_fptas",
+    "solve_memmap",
+    "solve_greedy",
+    "solve_multidim",
+    "solve_multiple_choice",
+    "solve_numba",
+    "solve_numpy",
+    "solve_parallel",
+    "solve_pareto",
+    "solve_prerequisites",
+    "solve_profile",
+    "solve_top_k",
+]
@@ -0,0 +1,69 @@
+"""Command line entry point: ``python -m knapsack_solver <command> ...``."""
+
+import argparse
+import json
+import sys
+
+from . import SOLVERS, bench
+from .batch import run_batch
+from .generators import KINDS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m knapsack_solver")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="solve every instance in a CSV, Parquet or JSON-lines manifest")
+    batch.add_argument("manifest", help="input .csv or .parquet (id,value,weight,capacity) or .jsonl file")
+    batch.add_argument("-o", "--output", help="write result JSON lines here instead of stdout")
+    batch.add_argument("--method", default="auto", choices=["auto", *SOLVERS])
+    batch.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    batch.add_argument("--chunksize", type=int, default=16, help="instances sent to a worker at a time")
+    batch.add_argument("--metrics", action="store_true",
+                       help="add per-phase timing, cells and table bytes to every result record")
+
+    bench_cmd = commands.add_parser("bench", help="benchmark solver modes on synthetic instances")
+    bench_cmd.add_argument("--n", type=int, nargs="+", default=[100, 1000], help="item counts")
+    bench_cmd.add_argument("--capacity", type=int, nargs="+", default=[1000, 100000], help="capacities")
+    bench_cmd.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    bench_cmd.add_argument("--methods", nargs="+", default=list(bench.DEFAULT_METHODS), choices=list(SOLVERS))
+    bench_cmd.add_argument("--seed", type=int, default=0)
+    bench_cmd.add_argument("--repeat", type=int, default=bench.DEFAULT_REPEATS,
+                           help="timed runs per case; the fastest is recorded")
+    bench_cmd.add_argument("-o", "--output", help="save the records as JSON here")
+    bench_cmd.add_argument("--baseline", help="JSON from an earlier run to check for regressions")
+    bench_cmd.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            summary = run_batch(args.manifest, out, args.method, args.workers, args.chunksize, args.metrics)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+
+    elif args.command == "bench":
+        records = bench.run_benchmarks(args.n, args.capacity, args.kinds, args.methods, args.seed, args.repeat)
+        for r in records:
+            rate = f"{r['cells_per_s']:.3g} cells/s" if r["cells_per_s"] else ""
+            ran = r["method"] if r["method"] == r["requested_method"] else f"{r['requested_method']}->{r['method']}"
+            print(f"{r['kind']:<28} n={r['n']:<7} C={r['capacity']:<9} {ran:<17} "
+                  f"{r['wall_s'] * 1000:10.2f} ms {r['peak_rss_kb'] / 1024:8.1f} MB {rate}")
+        if args.output:
+            bench.save(records, args.output)
+        if args.baseline:
+            regressions = bench.compare(records, bench.load(args.baseline), args.tolerance)
+            for r in regressions:
+                print(f"REGRESSION {r['kind']} n={r['n']} C={r['capacity']} {r['method']}: "
+                      f"{r['baseline_wall_s'] * 1000:.2f} ms -> {r['wall_s'] * 1000:.2f} ms "
+                      f"({r['slowdown']:.2f}x)", file=sys.stderr)
+            if regressions:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
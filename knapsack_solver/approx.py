@@ -0,0 +1,71 @@
+import math
+from dataclasses import replace
+
+from .branch_and_bound import density_order, fractional_bound
+from .dp import build_result, validate_instance
+from .metrics import phase
+from .value_dp import solve_by_value
+
+# Rough throughput of the value-indexed kernel, used to decide whether an
+# FPTAS run fits in the caller's latency budget.
+CELLS_PER_SECOND = 2 * 10**8
+
+
+def solve_greedy(values, weights, capacity, control=None, metrics=None):
+    """Greedy by value density, or the single best item if that is worth more.
+
+    Runs in O(n log n) and is guaranteed to reach at least half the optimum.
+    ``upper_bound`` is the tighter of the LP bound and twice the result.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    with phase(metrics, "search", len(values)):
+        free, items = density_order(values, weights, capacity)
+
+        packed, remaining = [], capacity
+        for i in items:
+            if weights[i] <= remaining:
+                packed.append(i)
+                remaining -= weights[i]
+        best_single = max(items, key=lambda i: values[i], default=None)
+        if best_single is not None and values[best_single] > sum(values[i] for i in packed):
+            packed = [best_single]
+    chosen = sorted(free + packed)
+
+    result = build_result(chosen, values, weights, capacity, "greedy")
+    bound = max(result.total_value, min(fractional_bound(values, weights, capacity), 2 * result.total_value))
+    return replace(result, optimal=result.total_value == bound, upper_bound=bound)
+
+
+def solve_fptas(values, weights, capacity, epsilon=0.1, latency_budget=None, control=None, metrics=None):
+    """Value-scaling FPTAS: at least ``(1 - epsilon)`` times the optimum.
+
+    Values are divided by ``K = epsilon * max_value / n`` and the scaled
+    instance is solved exactly with the value-indexed DP, which takes
+    O(n^2 / epsilon) cells. If ``latency_budget`` (seconds) is set and the
+    estimated DP would not fit in it, :func:`solve_greedy` answers instead.
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f"epsilon must be between 0 and 1, got {epsilon}")
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    useful = [i for i in range(len(values)) if values[i] > 0 and weights[i] <= capacity]
+    if not useful:
+        return replace(build_result([], values, weights, capacity, "fptas"), upper_bound=0)
+
+    scale = max(1.0, epsilon * max(values[i] for i in useful) / len(useful))
+    scaled = [math.floor(v / scale) if v > 0 else 0 for v in values]
+
+    if latency_budget is not None:
+        cells = len(useful) * (sum(scaled[i] for i in useful) + 1)
+        if cells > latency_budget * CELLS_PER_SECOND:
+            return solve_greedy(values, weights, capacity, metrics=metrics)
+
+    chosen = solve_by_value(scaled, weights, capacity, control=control, metrics=metrics).chosen
+    result = build_result(chosen, values, weights, capacity, "fptas")
+    if scale == 1.0:
+        # Nothing was rounded, so the scaled DP was exact
+        return replace(result, upper_bound=result.total_value)
+    bound = max(
+        result.total_value,
+        min(fractional_bound(values, weights, capacity), math.floor(result.total_value / (1 - epsilon))),
+    )
+    return replace(result, optimal=result.total_value == bound, upper_bound=bound)
@@ -0,0 +1,187 @@
+"""Headless batch solving of many independent instances on a process pool."""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from .io import TABLE_BATCH_ROWS, int_column, iter_table
+from .metrics import SolveMetrics
+
+
+def read_jsonl(path):
+    """Yield one instance dict per line: ``{"id", "values", "weights", "capacity"}``."""
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            record.setdefault("id", line_no)
+            yield record
+
+
+def read_table_instances(path, batch_rows=TABLE_BATCH_ROWS):
+    """Yield instances from a long-format ``.csv`` or ``.parquet`` table with one row per item.
+
+    Columns are ``id, value, weight, capacity``; consecutive rows with the
+    same ``id`` form one instance and its capacity is taken from the first.
+    The table is streamed ``batch_rows`` rows at a time into NumPy arrays
+    and each instance gets slices of them, never per-item Python lists. An
+    instance that runs past the end of a batch is carried into the next.
+    """
+    # Column slices of the instance that is still open at the end of the last batch
+    pieces = []
+    for table in iter_table(path, batch_rows=batch_rows):
+        if not len(table["id"]):
+            continue
+        columns = (
+            np.asarray(table["id"]).astype(str),
+            int_column(table, "value"),
+            int_column(table, "weight"),
+            int_column(table, "capacity"),
+        )
+        ids = columns[0]
+        ends = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        if pieces and pieces[-1][0][-1] != ids[0]:
+            # The open instance ended with the previous batch
+            ends = np.r_[0, ends]
+        start = 0
+        for end in ends.tolist():
+            if end:
+                pieces.append(tuple(column[start:end] for column in columns))
+            yield _table_instance(pieces)
+            pieces, start = [], end
+        pieces.append(tuple(column[start:] for column in columns))
+    if pieces:
+        yield _table_instance(pieces)
+
+
+def _table_instance(pieces):
+    if len(pieces) == 1:
+        ids, values, weights, capacities = pieces[0]
+    else:
+        ids, values, weights, capacities = (np.concatenate(column) for column in zip(*pieces))
+    return {
+        "id": str(ids[0]),
+        "values": values,
+        "weights": weights,
+        "capacity": int(capacities[0]),
+    }
+
+
+def read_manifest(path):
+    """Stream instances from a ``.csv``, ``.parquet`` or JSON-lines manifest."""
+    if str(path).lower().endswith((".csv", ".parquet")):
+        return read_table_instances(path)
+    return read_jsonl(path)
+
+
+def _solve_chunk(instances, method, options, with_metrics=False):
+    # Runs in a worker process; imported here so workers pay for it once
+    from . import solve
+
+    records = []
+    for instance in instances:
+        metrics = SolveMetrics() if with_metrics else None
+        start = time.perf_counter()
+        try:
+            result = solve(
+                instance["values"],
+                instance["weights"],
+                instance["capacity"],
+                method=instance.get("method", method),
+                metrics=metrics,
+                **options,
+            )
+        except (ValueError, TypeError, KeyError) as exc:
+            records.append({"id": instance.get("id"), "error": str(exc)})
+            continue
+        records.append({
+            "id": instance.get("id"),
+            "total_value": result.total_value,
+            "total_weight": result.total_weight,
+            "chosen": list(result.chosen),
+            "method": result.method,
+            "optimal": result.optimal,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+        })
+        if metrics is not None:
+            records[-1]["metrics"] = metrics.as_dict()
+    return records
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def solve_batch(instances, method="auto", workers=None, chunksize=16, with_metrics=False, **options):
+    """Solve ``instances`` in parallel and yield result records in input order.
+
+    Only ``4 * workers`` chunks are in flight at a time, so arbitrarily long
+    manifests are streamed rather than loaded into memory. With
+    ``with_metrics`` each record carries its per-phase ``metrics``.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(instances, chunksize):
+            pending.append(pool.submit(_solve_chunk, chunk, method, options, with_metrics))
+            if len(pending) >= 4 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def summarize(latencies_ms, elapsed, errors=0, phase_ms=None):
+    """Throughput and latency percentiles for a finished batch run.
+
+    ``phase_ms`` maps solve phases to their wall time summed over the run.
+    """
+    latencies_ms = sorted(latencies_ms)
+    count = len(latencies_ms)
+    summary = {
+        "instances": count,
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "throughput_per_s": count / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies_ms, 0.50),
+            "p90": percentile(latencies_ms, 0.90),
+            "p99": percentile(latencies_ms, 0.99),
+            "max": latencies_ms[-1] if latencies_ms else 0.0,
+        },
+    }
+    if phase_ms is not None:
+        summary["phase_ms"] = phase_ms
+    return summary
+
+
+def run_batch(manifest, out, method="auto", workers=None, chunksize=16, with_metrics=False, **options):
+    """Solve every instance in ``manifest``, write JSON lines to ``out`` and return the summary."""
+    latencies = []
+    errors = 0
+    phase_ms = {} if with_metrics else None
+    start = time.perf_counter()
+    for record in solve_batch(read_manifest(manifest), method, workers, chunksize, with_metrics, **options):
+        if "error" in record:
+            errors += 1
+        else:
+            latencies.append(record["latency_ms"])
+            for name, cost in record.get("metrics", {}).get("phases", {}).items():
+                phase_ms[name] = phase_ms.get(name, 0.0) + cost["wall_ms"]
+        out.write(json.dumps(record) + "\n")
+    return summarize(latencies, time.perf_counter() - start, errors, phase_ms)
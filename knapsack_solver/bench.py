@@ -0,0 +1,131 @@
+"""Benchmark every solver mode over a grid of synthetic instances."""
+
+import json
+import resource
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .generators import KINDS, generate
+from .metrics import SolveMetrics
+
+DEFAULT_METHODS = (
+    "dp", "numpy", "numba", "bitset", "parallel", "memmap", "value", "pareto", "branch_and_bound", "fptas", "greedy",
+)
+
+# The pure-Python table is skipped above this many cells so a grid run stays bounded
+DP_BENCH_CELL_LIMIT = 2 * 10**6
+
+# Time limit handed to the search-based modes so hard instances cannot stall a run
+SEARCH_TIME_LIMIT = 10.0
+
+# Timed runs per case; the fastest is compared, since noise only ever adds time
+DEFAULT_REPEATS = 5
+
+# Seconds of timed runs after which a slow case stops repeating
+REPEAT_TIME_BUDGET = 5.0
+
+
+def _run_case(case, repeats=DEFAULT_REPEATS):
+    # Runs in a fresh worker process so peak RSS belongs to this case alone
+    from . import solve
+
+    kind, n, capacity, method, seed = case
+    values, weights, capacity = generate(kind, n, capacity, seed=seed)
+    options = {"time_limit": SEARCH_TIME_LIMIT} if method == "branch_and_bound" else {}
+
+    walls, metrics = [], None
+    while len(walls) < max(1, repeats) and (not walls or sum(walls) < REPEAT_TIME_BUDGET):
+        run_metrics = SolveMetrics()
+        start = time.perf_counter()
+        result = solve(values, weights, capacity, method=method, metrics=run_metrics, **options)
+        walls.append(time.perf_counter() - start)
+        # The phase breakdown is the fastest run's, to match wall_s
+        if walls[-1] == min(walls):
+            metrics = run_metrics
+    wall = min(walls)
+
+    # Cells of the table the solve actually filled, after preprocessing shrank it
+    cells = metrics.phases.get("table fill", {}).get("cells") or None
+    return {
+        "kind": kind,
+        "n": n,
+        "capacity": capacity,
+        "requested_method": method,
+        # A mode can hand off to another, e.g. numba without Numba installed
+        "method": result.method,
+        "seed": seed,
+        "wall_s": wall,
+        "wall_median_s": statistics.median(walls),
+        "repeats": len(walls),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "cells": cells,
+        "cells_per_s": cells / wall if cells and wall > 0 else None,
+        "total_value": result.total_value,
+        "optimal": result.optimal,
+        "phases": metrics.as_dict()["phases"],
+    }
+
+
+def benchmark_cases(ns, capacities, kinds=KINDS, methods=DEFAULT_METHODS, seed=0):
+    for kind in kinds:
+        for n in ns:
+            for capacity in capacities:
+                for method in methods:
+                    if method == "dp" and n * (capacity + 1) > DP_BENCH_CELL_LIMIT:
+                        continue
+                    yield kind, n, capacity, method, seed
+
+
+def run_benchmarks(ns, capacities, kinds=KINDS, methods=DEFAULT_METHODS, seed=0, repeats=DEFAULT_REPEATS):
+    """Run every grid point in its own process and return the list of records.
+
+    Each case is timed ``repeats`` times (fewer once it has run for
+    :data:`REPEAT_TIME_BUDGET` seconds); ``wall_s`` is the fastest run and
+    ``wall_median_s`` the median.
+    """
+    records = []
+    for case in benchmark_cases(ns, capacities, kinds, methods, seed):
+        # A fresh, non-daemonic worker per case: its peak RSS is the case's
+        # own, and the parallel mode may start processes of its own
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            records.append(pool.submit(_run_case, case, repeats).result())
+    return records
+
+
+def _case_key(record):
+    # Baselines saved before requested_method was recorded only have method
+    method = record.get("requested_method", record["method"])
+    return record["kind"], record["n"], record["capacity"], method
+
+
+def compare(records, baseline, tolerance=0.25, min_wall_s=0.005):
+    """Return the records that got more than ``tolerance`` slower than ``baseline``.
+
+    Runs are compared on ``wall_s``, the fastest of each case's repeats.
+    Cases faster than ``min_wall_s`` in both runs are ignored because their
+    timings are mostly noise.
+    """
+    previous = {_case_key(r): r for r in baseline}
+    regressions = []
+    for record in records:
+        old = previous.get(_case_key(record))
+        if old is None or max(old["wall_s"], record["wall_s"]) < min_wall_s:
+            continue
+        if record["wall_s"] > old["wall_s"] * (1 + tolerance):
+            regressions.append({
+                **record,
+                "baseline_wall_s": old["wall_s"],
+                "slowdown": record["wall_s"] / old["wall_s"],
+            })
+    return regressions
+
+
+def save(records, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "records": records}, f, indent=2)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["records"]
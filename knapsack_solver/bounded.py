@@ -0,0 +1,71 @@
+import math
+
+from .dp import validate_instance
+from .result import KnapsackResult
+
+# Quantity meaning "as many as fit"
+UNLIMITED = math.inf
+
+
+def binary_split(quantity):
+    """Split ``quantity`` into parts 1, 2, 4, ..., remainder.
+
+    Any count from 0 to ``quantity`` is a sum of a subset of the parts, so
+    ``quantity`` copies of an item become O(log quantity) 0/1 items.
+    """
+    parts = []
+    part = 1
+    while quantity > 0:
+        take = min(part, quantity)
+        parts.append(take)
+        quantity -= take
+        part *= 2
+    return parts
+
+
+def solve_bounded(values, weights, capacity, quantities, method="auto", **options):
+    """Knapsack where item ``i`` may be taken up to ``quantities[i]`` times.
+
+    A quantity of :data:`UNLIMITED` (or ``None``) means as many as fit.
+    Each item is binary-split into 0/1 bundles and the expanded instance
+    goes through :func:`knapsack_solver.solve`. The result's ``counts``
+    give how many of each chosen item to take.
+    """
+    from . import solve
+
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    if len(quantities) != len(values):
+        raise ValueError(f"got {len(quantities)} quantities for {len(values)} items")
+
+    bundle_item, bundle_count, bundle_values, bundle_weights = [], [], [], []
+    for i, quantity in enumerate(quantities):
+        if quantity is None or quantity == UNLIMITED:
+            if weights[i] == 0:
+                if values[i] > 0:
+                    raise ValueError(f"item {i} has no weight, positive value and unlimited quantity")
+                continue
+            quantity = capacity // weights[i]
+        elif quantity < 0:
+            raise ValueError(f"quantities must be non-negative, got {quantity} for item {i}")
+        for part in binary_split(int(quantity)):
+            bundle_item.append(i)
+            bundle_count.append(part)
+            bundle_values.append(values[i] * part)
+            bundle_weights.append(weights[i] * part)
+
+    bundles = solve(bundle_values, bundle_weights, capacity, method=method, **options)
+
+    counts = {}
+    for b in bundles.chosen:
+        counts[bundle_item[b]] = counts.get(bundle_item[b], 0) + bundle_count[b]
+    chosen = tuple(sorted(counts))
+    return KnapsackResult(
+        chosen=chosen,
+        total_value=sum(values[i] * counts[i] for i in chosen),
+        total_weight=sum(weights[i] * counts[i] for i in chosen),
+        capacity=capacity,
+        method=bundles.method,
+        optimal=bundles.optimal,
+        upper_bound=bundles.upper_bound,
+        counts=tuple(counts[i] for i in chosen),
+    )
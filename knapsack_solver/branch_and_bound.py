@@ -0,0 +1,136 @@
+import time
+from bisect import bisect_right
+from dataclasses import replace
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+
+_CLOCK_CHECK_EVERY = 1024
+
+
+def density_order(values, weights, capacity):
+    """Split useful items into zero-weight freebies and the rest sorted by value density."""
+    free = [i for i in range(len(values)) if values[i] > 0 and weights[i] == 0]
+    items = [i for i in range(len(values)) if values[i] > 0 and 0 < weights[i] <= capacity]
+    items.sort(key=lambda i: values[i] / weights[i], reverse=True)
+    return free, items
+
+
+def fractional_bound(values, weights, capacity):
+    """Dantzig upper bound: the optimum of the LP relaxation, rounded down."""
+    free, items = density_order(values, weights, capacity)
+    total = sum(values[i] for i in free)
+    for i in items:
+        if weights[i] <= capacity:
+            capacity -= weights[i]
+            total += values[i]
+        else:
+            return total + capacity * values[i] // weights[i]
+    return total
+
+
+def suffix_bound(v, w):
+    """Return ``bound(k, cap, val)``: ``val`` plus the fractional bound of items ``k..`` within ``cap``.
+
+    ``v`` and ``w`` are the values and weights of items already sorted by
+    :func:`density_order`. Prefix sums let each call find the critical
+    item with one bisect.
+    """
+    m = len(v)
+    prefix_w = [0] * (m + 1)
+    prefix_v = [0] * (m + 1)
+    for k in range(m):
+        prefix_w[k + 1] = prefix_w[k] + w[k]
+        prefix_v[k + 1] = prefix_v[k] + v[k]
+
+    def bound(k, cap, val):
+        j = bisect_right(prefix_w, prefix_w[k] + cap, lo=k) - 1
+        val += prefix_v[j] - prefix_v[k]
+        if j < m:
+            val += (cap - (prefix_w[j] - prefix_w[k])) * v[j] // w[j]
+        return val
+
+    return bound
+
+
+def search_stopped(nodes, deadline, control):
+    """Whether a search at node ``nodes`` has passed ``deadline`` or its ``control`` was stopped.
+
+    The clock is only read every ``_CLOCK_CHECK_EVERY`` nodes.
+    """
+    return nodes % _CLOCK_CHECK_EVERY == 0 and (
+        (deadline is not None and time.perf_counter() > deadline)
+        or (control is not None and control.should_stop())
+    )
+
+
+def solve_branch_and_bound(values, weights, capacity, time_limit=None, node_limit=None, control=None,
+                           metrics=None):
+    """Exact depth-first branch and bound with the Dantzig fractional bound.
+
+    Items are explored in decreasing value density and a subtree is cut as
+    soon as its fractional-relaxation bound cannot beat the incumbent. The
+    search needs O(n) memory regardless of ``capacity``. If ``time_limit``
+    (seconds) or ``node_limit`` stops it early, the result carries the best
+    incumbent with ``optimal=False`` and the remaining ``upper_bound``;
+    a cancelled or expired ``control`` stops it the same way. The
+    ``search`` phase of ``metrics`` counts visited nodes as its cells.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    free, items = density_order(values, weights, capacity)
+    v = [values[i] for i in items]
+    w = [weights[i] for i in items]
+    m = len(items)
+    bound = suffix_bound(v, w)
+
+    # Greedy incumbent: take items in density order while they fit
+    best_val, best_path, cap = 0, None, capacity
+    for k in range(m):
+        if w[k] <= cap:
+            cap -= w[k]
+            best_val += v[k]
+            best_path = (k, best_path)
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    nodes = 0
+    stopped = False
+    # Each node is (next item, remaining capacity, value so far, taken items as a cons list)
+    stack = [(0, capacity, 0, None)]
+    with phase(metrics, "search"):
+        while stack:
+            nodes += 1
+            if node_limit is not None and nodes > node_limit:
+                stopped = True
+                break
+            if search_stopped(nodes, deadline, control):
+                stopped = True
+                break
+
+            k, cap, val, path = stack.pop()
+            if val > best_val:
+                best_val, best_path = val, path
+            if k == m or bound(k, cap, val) <= best_val:
+                continue
+            # Push the exclude branch first so the include branch is explored first
+            stack.append((k + 1, cap, val, path))
+            if w[k] <= cap:
+                stack.append((k + 1, cap - w[k], val + v[k], (k, path)))
+    if metrics is not None:
+        metrics.count("search", cells=nodes)
+
+    chosen = list(free)
+    while best_path is not None:
+        k, best_path = best_path
+        chosen.append(items[k])
+    chosen.sort()
+
+    result = build_result(chosen, values, weights, capacity, "branch_and_bound")
+    if not stopped:
+        return replace(result, upper_bound=result.total_value)
+    free_value = sum(values[i] for i in free)
+    open_bound = max((bound(k, cap, val) for k, cap, val, _ in stack), default=0)
+    return replace(
+        result,
+        optimal=False,
+        upper_bound=free_value + max(best_val, open_bound),
+    )
@@ -0,0 +1,70 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def instance_key(values, weights, capacity, method="auto", **options):
+    """Stable digest of a normalized problem instance and the solve settings."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(values, dtype=np.int64).tobytes())
+    digest.update(b"|")
+    digest.update(np.asarray(weights, dtype=np.int64).tobytes())
+    digest.update(f"|{int(capacity)}|{method}|{sorted(options.items())!r}".encode())
+    return digest.hexdigest()
+
+
+class SolveCache:
+    """Bounded LRU map from instance keys to :class:`KnapsackResult` objects.
+
+    Results are immutable, so one cache can safely be shared by every
+    session in the server process. All access goes through a lock.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache used by :func:`knapsack_solver.cached_solve`
+default_cache = SolveCache()
@@ -0,0 +1,68 @@
+import threading
+import time
+
+
+class SolveCancelled(Exception):
+    """Raised inside a solver whose :class:`SolveControl` was cancelled."""
+
+
+class SolveTimeout(SolveCancelled):
+    """Raised inside a solver whose :class:`SolveControl` ran out of time."""
+
+
+class SolveControl:
+    """Progress, cancellation and a time limit shared between a solver and its caller.
+
+    Solvers call :meth:`start` with the number of rows (or items) they will
+    process and :meth:`advance` after each one; ``advance`` raises
+    :class:`SolveCancelled` or :class:`SolveTimeout` so a table fill stops
+    within one row. Search-based solvers poll :meth:`should_stop` instead
+    and return their best incumbent. All methods are safe to call from
+    another thread.
+    """
+
+    def __init__(self, time_limit=None):
+        self.time_limit = time_limit
+        self.deadline = None if time_limit is None else time.monotonic() + time_limit
+        self.done = 0
+        self.total = 0
+        self._cancelled = threading.Event()
+
+    def start_clock(self):
+        """Count the time limit from now, e.g. once a queued job starts running."""
+        if self.time_limit is not None:
+            self.deadline = time.monotonic() + self.time_limit
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def timed_out(self):
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+    @property
+    def progress(self):
+        """Fraction of rows finished, between 0 and 1."""
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    def start(self, total):
+        self.total = total
+        self.done = 0
+        self.check()
+
+    def advance(self, steps=1):
+        self.done += steps
+        self.check()
+
+    def should_stop(self):
+        return self.cancelled or self.timed_out
+
+    def check(self):
+        if self.cancelled:
+            raise SolveCancelled("solve was cancelled")
+        if self.timed_out:
+            raise SolveTimeout(f"solve exceeded its time limit of {self.time_limit:g} s")
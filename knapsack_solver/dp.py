@@ -0,0 +1,91 @@
+import numpy as np
+
+from .metrics import list_table_bytes, phase
+from .result import KnapsackResult
+
+
+def validate_instance(values, weights, capacity):
+    """Check the inputs shared by every solver and return ``(values, weights, capacity)`` as ints."""
+    if len(values) != len(weights):
+        raise ValueError(f"got {len(values)} values but {len(weights)} weights")
+    capacity = int(capacity)
+    if capacity < 0:
+        raise ValueError(f"capacity must be non-negative, got {capacity}")
+    values = [int(v) for v in values]
+    weights = [int(w) for w in weights]
+    if any(w < 0 for w in weights):
+        raise ValueError("weights must be non-negative")
+    return values, weights, capacity
+
+
+def validate_arrays(values, weights, capacity):
+    """Like :func:`validate_instance`, but returns ``int64`` NumPy arrays.
+
+    Arrays that already are ``int64`` are used as they are, so large
+    uploaded instances are checked without building per-item Python ints.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    if len(values) != len(weights):
+        raise ValueError(f"got {len(values)} values but {len(weights)} weights")
+    capacity = int(capacity)
+    if capacity < 0:
+        raise ValueError(f"capacity must be non-negative, got {capacity}")
+    if (weights < 0).any():
+        raise ValueError("weights must be non-negative")
+    return values, weights, capacity
+
+
+def build_result(chosen, values, weights, capacity, method):
+    return KnapsackResult(
+        chosen=tuple(chosen),
+        total_value=sum(values[i] for i in chosen),
+        total_weight=sum(weights[i] for i in chosen),
+        capacity=capacity,
+        method=method,
+    )
+
+
+def solve_dp(values, weights, capacity, control=None, metrics=None):
+    """Classic O(n * capacity) 0/1 knapsack with a full table and backtracking.
+
+    An item is taken only when taking it is strictly better than skipping
+    it, which is the tie-breaking rule every other solver mode reproduces.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+
+    with phase(metrics, "table fill", n * (capacity + 1), list_table_bytes(n + 1, capacity + 1)):
+        # DP table
+        dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+
+        # Fill DP table
+        if control is not None:
+            control.start(n)
+        for i in range(1, n + 1):
+            if control is not None:
+                control.advance()
+            for w in range(capacity + 1):
+                if weights[i - 1] <= w:
+                    dp[i][w] = max(values[i - 1] + dp[i - 1][w - weights[i - 1]],
+                                   dp[i - 1][w])
+                else:
+                    dp[i][w] = dp[i - 1][w]
+
+    with phase(metrics, "backtrack", n):
+        # Backtrack to find selected items
+        res = dp[n][capacity]
+        w = capacity
+        chosen = []
+
+        for i in range(n, 0, -1):
+            if res <= 0:
+                break
+            if res == dp[i - 1][w]:
+                continue
+            chosen.append(i - 1)
+            res -= values[i - 1]
+            w -= weights[i - 1]
+
+    chosen.reverse()
+    return build_result(chosen, values, weights, capacity, "dp")
@@ -0,0 +1,41 @@
+"""Synthetic 0/1 knapsack instances in the classic Pisinger families."""
+
+import random
+
+KINDS = (
+    "uncorrelated",
+    "weakly_correlated",
+    "strongly_correlated",
+    "inverse_strongly_correlated",
+    "subset_sum",
+)
+
+
+def generate(kind, n, capacity, data_range=None, seed=0):
+    """Return ``(values, weights, capacity)`` for one instance of ``kind``.
+
+    Weights are drawn from ``1..data_range``. By default ``data_range`` is
+    chosen so the items weigh about twice the capacity in total, which
+    keeps roughly half of them in the optimum.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"unknown instance kind {kind!r}; expected one of {KINDS}")
+    if data_range is None:
+        data_range = max(2, 4 * capacity // max(n, 1))
+    rng = random.Random(seed)
+    weights = [rng.randint(1, data_range) for _ in range(n)]
+    r = data_range
+
+    if kind == "uncorrelated":
+        values = [rng.randint(1, r) for _ in range(n)]
+    elif kind == "weakly_correlated":
+        values = [max(1, w + rng.randint(-(r // 10), r // 10)) for w in weights]
+    elif kind == "strongly_correlated":
+        values = [w + r // 10 for w in weights]
+    elif kind == "inverse_strongly_correlated":
+        values = [rng.randint(1, r) for _ in range(n)]
+        weights = [v + r // 10 for v in values]
+    else:
+        values = list(weights)
+
+    return values, weights, capacity
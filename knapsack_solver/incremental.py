@@ -0,0 +1,135 @@
+import numpy as np
+
+from .dp import build_result
+
+
+class IncrementalKnapsack:
+    """0/1 knapsack whose DP rows survive between edits.
+
+    ``rows[i]`` is the best value over the first ``i`` items for every
+    capacity up to ``max_capacity``. Rows do not depend on the capacity
+    being asked about, so one table answers every capacity up to the
+    maximum:
+
+    * :meth:`append` adds one row in O(max_capacity);
+    * :meth:`update` and :meth:`remove` recompute only the rows from the
+      edited item onward;
+    * :meth:`extend_capacity` fills just the new columns of every row;
+    * :meth:`best_value` is O(1) and :meth:`solve` adds an O(n) backtrack.
+
+    Memory is ``(n + 1) * (max_capacity + 1)`` int64 cells.
+    """
+
+    def __init__(self, max_capacity, values=(), weights=()):
+        if len(values) != len(weights):
+            raise ValueError(f"got {len(values)} values but {len(weights)} weights")
+        if max_capacity < 0:
+            raise ValueError(f"capacity must be non-negative, got {max_capacity}")
+        self.max_capacity = int(max_capacity)
+        self._values = []
+        self._weights = []
+        self._rows = [np.zeros(self.max_capacity + 1, dtype=np.int64)]
+        for v, w in zip(values, weights):
+            self.append(v, w)
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def values(self):
+        return list(self._values)
+
+    @property
+    def weights(self):
+        return list(self._weights)
+
+    def _next_row(self, prev, value, weight):
+        row = prev.copy()
+        if weight <= self.max_capacity:
+            np.maximum(row[weight:], prev[:self.max_capacity + 1 - weight] + value, out=row[weight:])
+        return row
+
+    def _recompute_from(self, index):
+        del self._rows[index + 1:]
+        for i in range(index, len(self._values)):
+            self._rows.append(self._next_row(self._rows[i], self._values[i], self._weights[i]))
+
+    def append(self, value, weight):
+        value, weight = int(value), int(weight)
+        if weight < 0:
+            raise ValueError("weights must be non-negative")
+        self._values.append(value)
+        self._weights.append(weight)
+        self._rows.append(self._next_row(self._rows[-1], value, weight))
+
+    def update(self, index, value=None, weight=None):
+        """Change one item's value and/or weight and refresh the rows after it."""
+        if weight is not None and int(weight) < 0:
+            raise ValueError("weights must be non-negative")
+        if value is not None:
+            self._values[index] = int(value)
+        if weight is not None:
+            self._weights[index] = int(weight)
+        self._recompute_from(range(len(self._values))[index])
+
+    def remove(self, index):
+        index = range(len(self._values))[index]
+        del self._values[index]
+        del self._weights[index]
+        self._recompute_from(index)
+
+    def extend_capacity(self, max_capacity):
+        """Grow the capacity axis, computing only the new columns of each row."""
+        old = self.max_capacity
+        if max_capacity <= old:
+            return
+        self.max_capacity = int(max_capacity)
+        grown = [np.zeros(self.max_capacity + 1, dtype=np.int64)]
+        for i, row in enumerate(self._rows[1:]):
+            prev = grown[i]
+            new = np.empty(self.max_capacity + 1, dtype=np.int64)
+            new[:old + 1] = row
+            tail = prev[old + 1:].copy()
+            weight = self._weights[i]
+            # Columns that can still hold item i read the (already grown) previous row
+            start = max(old + 1, weight)
+            if start <= self.max_capacity:
+                shifted = prev[start - weight:self.max_capacity + 1 - weight] + self._values[i]
+                np.maximum(tail[start - old - 1:], shifted, out=tail[start - old - 1:])
+            new[old + 1:] = tail
+            grown.append(new)
+        self._rows = grown
+
+    def best_value(self, capacity=None):
+        return int(self._rows[-1][self._check_capacity(capacity)])
+
+    def profile(self):
+        """Best value for every capacity ``0..max_capacity``, as a read-only view."""
+        view = self._rows[-1].view()
+        view.flags.writeable = False
+        return view
+
+    def solve(self, capacity=None):
+        """Return the optimal :class:`KnapsackResult` for ``capacity``.
+
+        Picks the same items as :func:`knapsack_solver.solve_dp` would for
+        the current item list.
+        """
+        capacity = self._check_capacity(capacity)
+        w = capacity
+        chosen = []
+        for i in range(len(self._values), 0, -1):
+            # An item is taken exactly where it changed the row
+            if self._rows[i][w] != self._rows[i - 1][w]:
+                chosen.append(i - 1)
+                w -= self._weights[i - 1]
+        chosen.reverse()
+        return build_result(chosen, self._values, self._weights, capacity, "incremental")
+
+    def _check_capacity(self, capacity):
+        if capacity is None:
+            return self.max_capacity
+        capacity = int(capacity)
+        if not 0 <= capacity <= self.max_capacity:
+            raise ValueError(f"capacity must be between 0 and {self.max_capacity}, got {capacity}")
+        return capacity
@@ -0,0 +1,134 @@
+"""Read item tables from CSV, Parquet or NPY files straight into NumPy arrays."""
+
+from pathlib import Path
+
+import numpy as np
+
+SUPPORTED_SUFFIXES = (".csv", ".parquet", ".npy")
+
+# Rows :func:`iter_table` reads at a time
+TABLE_BATCH_ROWS = 1 << 16
+
+
+def _suffix(source, name):
+    name = name or getattr(source, "name", None) or str(source)
+    suffix = Path(name).suffix.lower()
+    if suffix not in SUPPORTED_SUFFIXES:
+        raise ValueError(f"unsupported file type {suffix or name!r}; expected one of {', '.join(SUPPORTED_SUFFIXES)}")
+    return suffix
+
+
+def _read_frame(source, suffix):
+    import pandas as pd
+
+    if suffix == ".parquet":
+        return pd.read_parquet(source)
+    try:
+        return pd.read_csv(source, engine="pyarrow")
+    except ImportError:
+        return pd.read_csv(source)
+
+
+def _frame_columns(frame):
+    frame.columns = [str(column).strip().lower() for column in frame.columns]
+    short = [column for column, missing in frame.isna().any().items() if missing]
+    if short:
+        raise ValueError(f"column(s) {', '.join(map(repr, short))} have fewer entries than there are items")
+    return {column: frame[column].to_numpy() for column in frame.columns}
+
+
+def read_table(source, name=None, columns=None):
+    """Return ``{column name: array}`` for a ``.csv``, ``.parquet`` or ``.npy`` file.
+
+    ``source`` is a path or a file-like object such as a Streamlit upload;
+    ``name`` gives the file name when ``source`` has none. Column names are
+    lower-cased. A plain 2-D ``.npy`` array has no column names, so its
+    columns are named by position from ``columns``. Raises ``ValueError``
+    when a column is shorter than the others.
+    """
+    suffix = _suffix(source, name)
+    if suffix == ".npy":
+        data = np.load(source, allow_pickle=False)
+        if data.dtype.names:
+            return {field.strip().lower(): data[field] for field in data.dtype.names}
+        if data.ndim != 2 or columns is None or data.shape[1] > len(columns):
+            raise ValueError(f"an unlabeled .npy file must be a 2-D array with the columns {', '.join(columns or ())}")
+        return {column: data[:, k] for k, column in enumerate(columns[:data.shape[1]])}
+
+    return _frame_columns(_read_frame(source, suffix))
+
+
+def iter_table(source, name=None, batch_rows=TABLE_BATCH_ROWS):
+    """Yield a ``.csv`` or ``.parquet`` file as :func:`read_table` dicts of at most ``batch_rows`` rows.
+
+    Only one batch is in memory at a time, so tables larger than RAM can
+    be streamed.
+    """
+    suffix = _suffix(source, name)
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_rows):
+            yield _frame_columns(batch.to_pandas())
+    elif suffix == ".csv":
+        import pandas as pd
+
+        with pd.read_csv(source, chunksize=batch_rows) as reader:
+            for frame in reader:
+                yield _frame_columns(frame)
+    else:
+        raise ValueError(f"cannot stream {suffix!r} files; expected .csv or .parquet")
+
+
+def int_column(table, column):
+    """``table[column]`` as an ``int64`` array; floats must hold whole numbers."""
+    if column not in table:
+        raise ValueError(f"missing column {column!r}; found {', '.join(map(repr, table)) or 'none'}")
+    data = np.asarray(table[column])
+    if data.dtype.kind in "biu":
+        return data.astype(np.int64, copy=False)
+    if data.dtype.kind == "f":
+        if not np.isfinite(data).all() or (data != np.floor(data)).any():
+            raise ValueError(f"column {column!r} must hold whole numbers")
+        return data.astype(np.int64)
+    raise ValueError(f"column {column!r} must be numeric, got {data.dtype}")
+
+
+def read_items(source, columns, optional=(), nonnegative=(), labels=(), name=None):
+    """Read one instance's item columns from an uploaded table.
+
+    Returns ``{column: int64 array}`` for every column in ``columns`` and
+    for those in ``optional`` that the file has, plus ``"name"`` and any
+    ``labels`` columns (e.g. a group) the file has as object arrays.
+    Columns listed in ``nonnegative`` (e.g. weights) must not hold
+    negative numbers.
+    """
+    table = read_table(source, name=name, columns=list(columns) + list(optional))
+    items = {column: int_column(table, column) for column in columns}
+    items.update({column: int_column(table, column) for column in optional if column in table})
+    for column in nonnegative:
+        if column in items and (items[column] < 0).any():
+            raise ValueError(f"column {column!r} must be non-negative")
+    for column in ("name", *labels):
+        if column in table:
+            items[column] = np.asarray(table[column], dtype=object)
+    return items
+
+
+class ItemNames:
+    """Stand-in name list, ``"Item 1"``, ``"Item 2"``, ..., built on demand."""
+
+    def __init__(self, count, prefix="Item"):
+        self.count = count
+        self.prefix = prefix
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"ItemNames({self.count!r}, {self.prefix!r})"
+
+    def __getitem__(self, i):
+        if not -self.count <= i < self.count:
+            raise IndexError(i)
+        return f"{self.prefix} {i % self.count + 1}"
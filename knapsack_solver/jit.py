@@ -0,0 +1,100 @@
+"""Optional Numba-compiled DP kernel, used when Numba is installed.
+
+The kernels are compiled on first use, not at import, and with
+``cache=True`` so the machine code is written next to this module (or to
+``NUMBA_CACHE_DIR``) and later server starts load it instead of compiling
+again. Without Numba, :func:`solve_numba` runs the NumPy path.
+"""
+
+import functools
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+from .vectorized import PACKED_CELL_THRESHOLD, keep_table_bytes, solve_bitset, solve_numpy
+
+# Cells filled per kernel call; progress and cancellation are checked between calls
+KERNEL_CHUNK_CELLS = 1 << 22
+
+
+@functools.lru_cache(maxsize=None)
+def _kernels():
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, nogil=True)
+    def fill_rows(values, weights, row, keep, start, stop, packed):
+        # One in-place row per item, walking the capacity axis downwards so
+        # row[w - wt] still holds the previous item's value
+        capacity = row.shape[0] - 1
+        for i in range(start, stop):
+            wt = weights[i]
+            v = values[i]
+            for w in range(capacity, wt - 1, -1):
+                candidate = row[w - wt] + v
+                if candidate > row[w]:
+                    row[w] = candidate
+                    if packed:
+                        keep[i, w >> 3] |= np.uint8(1 << (7 - (w & 7)))
+                    else:
+                        keep[i, w] = 1
+
+    @numba.njit(cache=True, nogil=True)
+    def backtrack(keep, weights, capacity, packed):
+        taken = np.zeros(weights.shape[0], dtype=np.bool_)
+        w = capacity
+        for i in range(weights.shape[0] - 1, -1, -1):
+            if packed:
+                bit = (keep[i, w >> 3] >> (7 - (w & 7))) & 1
+            else:
+                bit = keep[i, w]
+            if bit:
+                taken[i] = True
+                w -= weights[i]
+        return taken
+
+    return fill_rows, backtrack
+
+
+def numba_available():
+    """Whether the compiled kernel can be used (compiles or loads it on first call)."""
+    return _kernels() is not None
+
+
+def solve_numba(values, weights, capacity, control=None, metrics=None):
+    """Compiled 0/1 knapsack; picks the same items as :func:`solve_dp`.
+
+    The fill and the backtrack run as machine code with the GIL released,
+    so there is no per-item Python overhead. The keep table is bit-packed
+    above :data:`PACKED_CELL_THRESHOLD` cells, like ``solve(method="auto")``
+    does. Without Numba this is :func:`solve_numpy` or :func:`solve_bitset`.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+    packed = n * (capacity + 1) > PACKED_CELL_THRESHOLD
+    kernels = _kernels()
+    if kernels is None:
+        fallback = solve_bitset if packed else solve_numpy
+        return fallback(values, weights, capacity, control=control, metrics=metrics)
+
+    fill_rows, backtrack = kernels
+    item_values = np.asarray(values, dtype=np.int64)
+    item_weights = np.asarray(weights, dtype=np.int64)
+    with phase(metrics, "table fill", n * (capacity + 1), keep_table_bytes(n, capacity, packed)):
+        row = np.zeros(capacity + 1, dtype=np.int64)
+        keep = np.zeros((n, (capacity + 8) // 8 if packed else capacity + 1), dtype=np.uint8)
+        step = max(1, KERNEL_CHUNK_CELLS // (capacity + 1))
+        if control is not None:
+            control.start(n)
+        for start in range(0, n, step):
+            stop = min(n, start + step)
+            fill_rows(item_values, item_weights, row, keep, start, stop, packed)
+            if control is not None:
+                control.advance(stop - start)
+
+    with phase(metrics, "backtrack", n):
+        chosen = np.flatnonzero(backtrack(keep, item_weights, capacity, packed)).tolist()
+    return build_result(chosen, values, weights, capacity, "numba")
@@ -0,0 +1,80 @@
+"""Background solve jobs that outlive the caller, e.g. a Streamlit script rerun."""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .control import SolveControl
+
+
+class SolveJob:
+    """One call of ``fn(control)`` running on a worker thread.
+
+    The time limit counts from when a worker picks the job up, not from
+    when it was queued. ``metrics`` is the :class:`SolveMetrics` the job
+    reports into, if any, kept with the job so whoever re-attaches to it
+    can read it.
+    """
+
+    def __init__(self, executor, fn, time_limit=None, metrics=None):
+        self.control = SolveControl(time_limit)
+        self.metrics = metrics
+        self._future = executor.submit(self._run, fn)
+
+    def _run(self, fn):
+        self.control.start_clock()
+        return fn(self.control)
+
+    def done(self):
+        return self._future.done()
+
+    def cancel(self):
+        self.control.cancel()
+
+    @property
+    def progress(self):
+        return 1.0 if self.done() else self.control.progress
+
+    def result(self, timeout=None):
+        """The value ``fn`` returned; re-raises whatever it raised."""
+        return self._future.result(timeout)
+
+    @property
+    def reusable(self):
+        """Still running, or finished with a result worth handing out again."""
+        if not self.done():
+            return True
+        error = self._future.exception()
+        return error is None
+
+
+class JobRunner:
+    """Runs solve jobs on a small thread pool and remembers the recent ones by key.
+
+    Submitting a key that is already running or already finished returns
+    the existing job, so repeated requests never redo work. Cancelled and
+    failed jobs are replaced.
+    """
+
+    def __init__(self, max_workers=2, max_jobs=64):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="solve")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, time_limit=None, metrics=None):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.reusable:
+                self._jobs.move_to_end(key)
+                return job
+            job = SolveJob(self._executor, fn, time_limit, metrics)
+            self._jobs[key] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+            return job
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
@@ -0,0 +1,79 @@
+"""Per-phase cost of a solve: wall time, cells evaluated and peak table bytes."""
+
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+# Phases in the order a page or batch run goes through them
+PHASES = ("parse", "preprocess", "table fill", "search", "backtrack", "render")
+
+
+class SolveMetrics:
+    """Collects what each phase of one solve cost, plus its cache hits and misses.
+
+    Solvers take an optional ``metrics`` argument and report into it through
+    :func:`phase`; the caller owns the object and reads it afterwards, so
+    results stay the same whether or not anyone is measuring. ``cells`` adds
+    up across calls to the same phase and ``peak_bytes`` keeps the largest.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _record(self, name):
+        return self.phases.setdefault(name, {"wall_ms": 0.0, "cells": 0, "peak_bytes": 0})
+
+    def count(self, name, cells=0, table_bytes=0):
+        record = self._record(name)
+        record["cells"] += int(cells)
+        record["peak_bytes"] = max(record["peak_bytes"], int(table_bytes))
+
+    @contextmanager
+    def timer(self, name):
+        record = self._record(name)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] += (time.perf_counter() - start) * 1000
+
+    @property
+    def total_ms(self):
+        return sum(record["wall_ms"] for record in self.phases.values())
+
+    @property
+    def peak_bytes(self):
+        return max((record["peak_bytes"] for record in self.phases.values()), default=0)
+
+    def rows(self):
+        """One dict per phase, in :data:`PHASES` order, for tables and charts."""
+        order = {name: k for k, name in enumerate(PHASES)}
+        names = sorted(self.phases, key=lambda name: order.get(name, len(order)))
+        return [{"phase": name, **self.phases[name]} for name in names]
+
+    def as_dict(self):
+        return {
+            "phases": {name: dict(record) for name, record in self.phases.items()},
+            "total_ms": self.total_ms,
+            "peak_bytes": self.peak_bytes,
+            "cache": {"hits": self.cache_hits, "misses": self.cache_misses},
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+def phase(metrics, name, cells=0, table_bytes=0):
+    """Time a ``with`` block as phase ``name`` of ``metrics``; a no-op when ``metrics`` is None."""
+    if metrics is None:
+        return nullcontext()
+    metrics.count(name, cells, table_bytes)
+    return metrics.timer(name)
+
+
+def list_table_bytes(rows, columns):
+    """Approximate size of a ``rows x columns`` list-of-lists table of small ints."""
+    return rows * (sys.getsizeof([]) + 8 * columns)
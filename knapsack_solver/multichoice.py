@@ -0,0 +1,80 @@
+from dataclasses import replace
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+
+
+def undominated_options(values, weights, capacity, members):
+    """The options of one group worth considering, lightest first.
+
+    An option is dropped if it is worth nothing (taking no option is
+    better), does not fit, or is dominated: another option weighs no more
+    and is worth at least as much.
+    """
+    options = sorted((i for i in members if values[i] > 0 and weights[i] <= capacity),
+                     key=lambda i: (weights[i], -values[i]))
+    kept, best = [], 0
+    for i in options:
+        if values[i] > best:
+            kept.append(i)
+            best = values[i]
+    return kept
+
+
+def solve_multiple_choice(groups, values, weights, capacity, control=None, metrics=None):
+    """0/1 knapsack taking at most one item from each group.
+
+    ``groups[i]`` labels the group of item ``i``, e.g. the material a
+    supplier offers. Each group is first cut to its undominated options
+    (:func:`undominated_options`), then the DP adds one group per row: a
+    cell keeps the best of not using the group and each surviving option,
+    so the work is O(surviving options * capacity) rather than over every
+    raw candidate. ``preprocess`` on the result counts the options before
+    and after pruning.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    if len(groups) != len(values):
+        raise ValueError(f"got {len(groups)} groups for {len(values)} items")
+
+    with phase(metrics, "preprocess", len(values)):
+        members = {}
+        for i, group in enumerate(groups):
+            members.setdefault(group, []).append(i)
+        options = [undominated_options(values, weights, capacity, items) for items in members.values()]
+        options = [group for group in options if group]
+    surviving = sum(len(group) for group in options)
+
+    # choice[g, w]: 1 + which option of group g is used at capacity w, or 0 for none
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    widest = max((len(group) for group in options), default=0)
+    choice = np.zeros((len(options), capacity + 1), dtype=np.uint8 if widest < 256 else np.int32)
+    with phase(metrics, "table fill", surviving * (capacity + 1), choice.nbytes + 16 * (capacity + 1)):
+        if control is not None:
+            control.start(len(options))
+        for g, group in enumerate(options):
+            if control is not None:
+                control.advance()
+            best = row.copy()
+            for k, i in enumerate(group, start=1):
+                wt = weights[i]
+                candidate = row[:capacity + 1 - wt] + values[i]
+                # Strictly better only, so on a tie the lighter option or none is kept
+                better = candidate > best[wt:]
+                best[wt:][better] = candidate[better]
+                choice[g, wt:][better] = k
+            row = best
+
+    with phase(metrics, "backtrack", len(options)):
+        chosen, w = [], capacity
+        for g in range(len(options) - 1, -1, -1):
+            k = int(choice[g, w])
+            if k:
+                i = options[g][k - 1]
+                chosen.append(i)
+                w -= weights[i]
+        chosen.sort()
+
+    result = build_result(chosen, values, weights, capacity, "multiple_choice")
+    return replace(result, preprocess={"items_before": len(values), "items_after": surviving})
@@ -0,0 +1,306 @@
+import math
+
+import numpy as np
+
+from .metrics import phase
+from .result import KnapsackResult
+
+
+def _validate(values, weights, capacities):
+    capacities = tuple(int(c) for c in capacities)
+    if not capacities:
+        raise ValueError("at least one capacity is required")
+    if any(c < 0 for c in capacities):
+        raise ValueError(f"capacities must be non-negative, got {capacities}")
+    if len(values) != len(weights):
+        raise ValueError(f"got {len(values)} values but {len(weights)} weight vectors")
+    values = [int(v) for v in values]
+    weights = [tuple(int(x) for x in w) for w in weights]
+    for i, w in enumerate(weights):
+        if len(w) != len(capacities):
+            raise ValueError(f"item {i} has {len(w)} resource weights, expected {len(capacities)}")
+        if any(x < 0 for x in w):
+            raise ValueError("weights must be non-negative")
+    return values, weights, capacities
+
+
+def _surrogate_weights(weights, capacities):
+    """Each item's resource use summed across resources, scaled by the limits."""
+    scales = [1 / c if c else 0.0 for c in capacities]
+    return [sum(x * s for x, s in zip(w, scales)) for w in weights]
+
+
+class _SuffixBound:
+    """LP-relaxation bound for the items not yet added to the DP.
+
+    Relaxing all but one constraint gives a fractional (Dantzig) bound per
+    resource, and relaxing them into their capacity-scaled sum gives a
+    surrogate one. Every one of them bounds the full LP relaxation from
+    above, so the smallest is returned. Each resource's density order is
+    sorted once; :meth:`remove` drops an item as the DP adds it, and a
+    call bounds every state at once.
+    """
+
+    def __init__(self, values, weights, surrogate, capacities, items):
+        self.scales = np.array([1 / c if c else 0.0 for c in capacities])
+        values = np.array([values[i] for i in items], dtype=np.float64)
+        rows = np.array([weights[i] for i in items], dtype=np.float64).reshape(len(items), len(capacities))
+        rows = np.column_stack((rows, [surrogate[i] for i in items]))
+        self.position = {item: k for k, item in enumerate(items)}
+        self.alive = np.ones(len(items), dtype=bool)
+        self.dims = []
+        for row in rows.T:
+            free = row == 0
+            order = np.flatnonzero(~free)
+            order = order[np.argsort(-values[order] / row[order], kind="stable")]
+            self.dims.append((free, order, values, row))
+
+    def remove(self, item):
+        self.alive[self.position[item]] = False
+
+    def __call__(self, remaining):
+        """Bounds for a ``(states, resources)`` array of remaining capacities."""
+        caps = np.column_stack((remaining, remaining @ self.scales))
+        best = None
+        for (free, order, values, row), cap in zip(self.dims, caps.T):
+            order = order[self.alive[order]]
+            prefix_w = np.concatenate(([0.0], np.cumsum(row[order])))
+            prefix_v = np.concatenate(([0.0], np.cumsum(values[order])))
+            j = np.searchsorted(prefix_w, cap, side="right") - 1
+            bound = values[free & self.alive].sum() + prefix_v[j]
+            partial = j < len(order)
+            k = order[j[partial]]
+            # The tiny slack absorbs float rounding in the surrogate row
+            bound[partial] += (cap[partial] - prefix_w[j[partial]]) * values[k] / row[k]
+            bound = np.floor(bound + 1e-9).astype(np.int64)
+            best = bound if best is None else np.minimum(best, bound)
+        return best
+
+
+# Largest compressed usage grid the two-resource dominance check fills densely
+_DOMINANCE_GRID_CELLS = 1 << 22
+
+# States compared pairwise at once by the dominance check for three or more
+# resources, and the most usage entries one comparison may broadcast to
+_DOMINANCE_BLOCK = 64
+_DOMINANCE_CHUNK_CELLS = 1 << 22
+
+
+def _undominated_pairs(usage, value, keep):
+    # Two resources, swept in lexicographic order: a state loses to an
+    # earlier one that uses no more of the second resource and is worth as
+    # much. Equal usage was settled by the caller.
+    rows, ranks0 = np.unique(usage[:, 0], return_inverse=True)
+    cols, ranks1 = np.unique(usage[:, 1], return_inverse=True)
+    ranks0, ranks1 = ranks0.reshape(-1), ranks1.reshape(-1)
+    live = np.flatnonzero(keep)
+    if len(rows) * len(cols) <= _DOMINANCE_GRID_CELLS:
+        # Best value in every rectangle [0, r0] x [0, r1] of the usage grid at once
+        grid = np.full((len(rows), len(cols)), -1, dtype=np.int64)
+        grid[ranks0[live], ranks1[live]] = value[live]
+        np.maximum.accumulate(grid, axis=0, out=grid)
+        np.maximum.accumulate(grid, axis=1, out=grid)
+        r0, r1 = ranks0[live], ranks1[live]
+        # The rectangle without the state's own cell is the two one-smaller rectangles
+        other = np.full(len(live), -1, dtype=np.int64)
+        other[r0 > 0] = grid[r0[r0 > 0] - 1, r1[r0 > 0]]
+        other[r1 > 0] = np.maximum(other[r1 > 0], grid[r0[r1 > 0], r1[r1 > 0] - 1])
+        keep[live[other >= value[live]]] = False
+        return
+    # Otherwise a Fenwick tree keeps the best value at or below each second-resource rank
+    tree = [-1] * (len(cols) + 1)
+    for s, r, v in zip(live.tolist(), (ranks1[live] + 1).tolist(), value[live].tolist()):
+        best, k = -1, r
+        while k:
+            if tree[k] > best:
+                best = tree[k]
+            k &= k - 1
+        if best >= v:
+            keep[s] = False
+            continue
+        while r <= len(cols):
+            if tree[r] < v:
+                tree[r] = v
+            r += r & -r
+
+
+def _beaten_within(usage, value):
+    # Pairwise check of a small set of sorted states against the ones before them
+    beats = (usage <= usage[:, None, :]).all(axis=2) & (value >= value[:, None])
+    return np.tril(beats, -1).any(axis=1)
+
+
+def _beaten_by_lower(usage, value, lower, upper):
+    # Which upper states some lower state beats on the second and third
+    # resource; the first is already no larger. Lower states are placed at
+    # the rounded-up cell of a compressed (and, past the grid limit,
+    # coarsened) usage grid and upper ones are looked up at the rounded-down
+    # cell, so a hit is always a real dominator; a coarse grid only misses some.
+    side = max(1, math.isqrt(_DOMINANCE_GRID_CELLS))
+    cells_lower, cells_upper, shape = [], [], []
+    for d in (1, 2):
+        coords = np.unique(np.concatenate((usage[lower, d], usage[upper, d])))
+        buckets = min(len(coords), side)
+        rank_lower = np.searchsorted(coords, usage[lower, d])
+        rank_upper = np.searchsorted(coords, usage[upper, d])
+        cells_lower.append(-(-rank_lower * buckets // len(coords)))
+        cells_upper.append(rank_upper * buckets // len(coords))
+        shape.append(buckets + 1)
+    grid = np.full(shape, -1, dtype=np.int64)
+    np.maximum.at(grid, tuple(cells_lower), value[lower])
+    np.maximum.accumulate(grid, axis=0, out=grid)
+    np.maximum.accumulate(grid, axis=1, out=grid)
+    return grid[tuple(cells_upper)] >= value[upper]
+
+
+def _undominated_triples(usage, value, keep):
+    # Three resources, divide and conquer over the sorted states: each half
+    # is checked on its own, and the upper half against the lower one, which
+    # uses no more of the first resource, with a two-resource grid lookup.
+    # A state beaten by a dominated one is also beaten by whatever dominated
+    # that one, so the checks need no particular order.
+    beaten = np.zeros(len(keep), dtype=bool)
+    parts = [np.flatnonzero(keep)]
+    while parts:
+        part = parts.pop()
+        if len(part) <= _DOMINANCE_BLOCK:
+            beaten[part] |= _beaten_within(usage[part], value[part])
+            continue
+        lower, upper = part[:len(part) // 2], part[len(part) // 2:]
+        beaten[upper] |= _beaten_by_lower(usage, value, lower, upper)
+        parts += [lower, upper]
+    keep &= ~beaten
+
+
+def _undominated_blocks(usage, value, keep):
+    # Four or more resources: the sorted states are compared a block at a
+    # time, against the undominated states of earlier blocks and against the
+    # earlier states of their own block.
+    candidates = np.flatnonzero(keep)
+    kept = np.empty(len(candidates), dtype=np.intp)
+    kept_count = 0
+    for start in range(0, len(candidates), _DOMINANCE_BLOCK):
+        block = candidates[start:start + _DOMINANCE_BLOCK]
+        block_usage, block_value = usage[block], value[block]
+        beaten = _beaten_within(block_usage, block_value)
+        step = max(1, _DOMINANCE_CHUNK_CELLS // block_usage.size)
+        for lo in range(0, kept_count, step):
+            earlier = kept[lo:min(lo + step, kept_count)]
+            beaten |= ((usage[earlier] <= block_usage[:, None, :]).all(axis=2)
+                       & (value[earlier] >= block_value[:, None])).any(axis=1)
+        keep[block[beaten]] = False
+        survivors = block[~beaten]
+        kept[kept_count:kept_count + len(survivors)] = survivors
+        kept_count += len(survivors)
+
+
+def _undominated(usage, value):
+    """Mask of the states no other state beats on value while using no more of every resource.
+
+    States are sorted by usage with the most valuable first among equal
+    usage, so duplicates are dropped in one pass and a state can only be
+    dominated by one before it. One resource needs a running maximum. Two
+    use a 2-D prefix maximum over the compressed usage grid when it is
+    small, or a Fenwick sweep in O(S log S) otherwise. Three split the
+    states in halves recursively and look the upper half up in a 2-D grid
+    of the lower one; past the grid limit that may keep a few dominated
+    states, which costs time but never the optimum. More resources
+    compare blocks of states with the undominated ones before them.
+    """
+    count, dims = usage.shape
+    order = np.lexsort((-value,) + tuple(usage[:, d] for d in range(dims - 1, -1, -1)))
+    usage, value = usage[order], value[order]
+    keep = np.ones(count, dtype=bool)
+    keep[1:] = (usage[1:] != usage[:-1]).any(axis=1)
+    if dims == 1:
+        keep[1:] &= value[1:] > np.maximum.accumulate(value)[:-1]
+    elif dims == 2:
+        _undominated_pairs(usage, value, keep)
+    elif dims == 3:
+        _undominated_triples(usage, value, keep)
+    else:
+        _undominated_blocks(usage, value, keep)
+    mask = np.zeros(count, dtype=bool)
+    mask[order[keep]] = True
+    return mask
+
+
+def solve_multidim(values, weights, capacities, control=None, metrics=None):
+    """Exact 0/1 knapsack with several resource limits (weight and volume, credits and hours...).
+
+    ``weights[i]`` is a tuple with item ``i``'s use of every resource and
+    ``capacities`` holds the matching limits. Instead of a dense
+    d-dimensional table the DP keeps sparse arrays of the resource usage
+    and best value of every reachable state, each linked to its
+    predecessor for reconstruction. After each item, states whose value
+    plus the LP-relaxation bound of the remaining items cannot beat the
+    best value found so far are cut, and dominated states (more of every
+    resource for no more value) are dropped with a sort-and-sweep pass.
+    """
+    values, weights, capacities = _validate(values, weights, capacities)
+    dims = len(capacities)
+    surrogate = _surrogate_weights(weights, capacities)
+    items = [i for i in range(len(values))
+             if values[i] > 0 and all(w <= c for w, c in zip(weights[i], capacities))]
+    # Dense items first, so good states and a strong incumbent appear early
+    items.sort(key=lambda i: values[i] / surrogate[i] if surrogate[i] else float("inf"), reverse=True)
+
+    # Greedy fill in the same order gives the starting incumbent
+    best_value, used = 0, [0] * dims
+    for i in items:
+        if all(u + w <= c for u, w, c in zip(used, weights[i], capacities)):
+            used = [u + w for u, w in zip(used, weights[i])]
+            best_value += values[i]
+
+    limits = np.array(capacities, dtype=np.int64)
+    usage = np.zeros((1, dims), dtype=np.int64)
+    value = np.zeros(1, dtype=np.int64)
+    bound = _SuffixBound(values, weights, surrogate, capacities, items)
+    # Per item: for every surviving state, its predecessor's position and whether the item was taken
+    parents, takes = [], []
+    merged = stored_bytes = peak_bytes = 0
+    with phase(metrics, "table fill"):
+        if control is not None:
+            control.start(len(items))
+        for i in items:
+            if control is not None:
+                control.advance()
+            bound.remove(i)
+            item_usage = np.array(weights[i], dtype=np.int64)
+            fits = np.flatnonzero((usage + item_usage <= limits).all(axis=1))
+            cand_usage = np.concatenate((usage, usage[fits] + item_usage))
+            cand_value = np.concatenate((value, value[fits] + values[i]))
+            source = np.concatenate((np.arange(len(usage)), fits))
+            taken = np.zeros(len(cand_value), dtype=bool)
+            taken[len(usage):] = True
+            merged += len(cand_value)
+            best_value = max(best_value, int(cand_value.max()))
+
+            # Cut states that cannot reach the incumbent before the dominance sweep
+            survive = np.flatnonzero(cand_value + bound(limits - cand_usage) >= best_value)
+            survive = survive[_undominated(cand_usage[survive], cand_value[survive])]
+            usage, value = cand_usage[survive], cand_value[survive]
+            parents.append(source[survive])
+            takes.append(taken[survive])
+            stored_bytes += parents[-1].nbytes + takes[-1].nbytes
+            peak_bytes = max(peak_bytes, stored_bytes + cand_usage.nbytes + cand_value.nbytes)
+    if metrics is not None:
+        metrics.count("table fill", merged, peak_bytes)
+
+    state = int(np.argmax(value))
+    total_value, total_usage = int(value[state]), tuple(int(u) for u in usage[state])
+    chosen = []
+    for k in range(len(items) - 1, -1, -1):
+        if takes[k][state]:
+            chosen.append(items[k])
+        state = parents[k][state]
+    chosen.sort()
+    return KnapsackResult(
+        chosen=tuple(chosen),
+        total_value=total_value,
+        total_weight=total_usage[0],
+        capacity=capacities[0],
+        method="multidim",
+        upper_bound=total_value,
+        usage=total_usage,
+    )
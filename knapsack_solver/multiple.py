@@ -0,0 +1,134 @@
+import time
+
+from .branch_and_bound import density_order, search_stopped, suffix_bound
+from .dp import validate_instance
+from .metrics import phase
+from .result import FleetResult
+
+def _validate_fleet(values, weights, capacities):
+    capacities = [int(c) for c in capacities]
+    if not capacities:
+        raise ValueError("at least one vehicle capacity is required")
+    for capacity in capacities:
+        values, weights, _ = validate_instance(values, weights, capacity)
+    return values, weights, capacities
+
+
+def _fleet_result(assignments, values, weights, capacities, method, optimal=True, upper_bound=None):
+    assignments = tuple(tuple(sorted(items)) for items in assignments)
+    total_value = sum(values[i] for items in assignments for i in items)
+    return FleetResult(
+        assignments=assignments,
+        capacities=tuple(capacities),
+        loads=tuple(sum(weights[i] for i in items) for items in assignments),
+        total_value=total_value,
+        method=method,
+        optimal=optimal,
+        upper_bound=total_value if optimal else upper_bound,
+    )
+
+
+def solve_fleet_greedy(values, weights, capacities):
+    """Fill the vehicles one at a time, smallest first, each with an exact single-knapsack solve.
+
+    Fast and usually good, but not optimal for the fleet as a whole.
+    """
+    from . import solve
+
+    values, weights, capacities = _validate_fleet(values, weights, capacities)
+    remaining = list(range(len(values)))
+    assignments = [[] for _ in capacities]
+    for k in sorted(range(len(capacities)), key=lambda k: capacities[k]):
+        result = solve([values[i] for i in remaining], [weights[i] for i in remaining], capacities[k])
+        assignments[k] = [remaining[j] for j in result.chosen]
+        taken = set(assignments[k])
+        remaining = [i for i in remaining if i not in taken]
+    return _fleet_result(assignments, values, weights, capacities, "greedy", optimal=False)
+
+
+def solve_fleet(values, weights, capacities, time_limit=None, node_limit=None, control=None, metrics=None):
+    """Exact multiple knapsack: assign each item to at most one vehicle.
+
+    Depth-first branch and bound over items in value-density order. Each
+    item goes to one of the vehicles that can still hold it, or to none;
+    vehicles with the same remaining capacity are interchangeable, so
+    only one of them is tried. Subtrees are pruned with the fractional
+    bound of the remaining items against the fleet's total remaining
+    capacity. The search starts from :func:`solve_fleet_greedy` and the
+    root bound is the exact single-knapsack optimum on the summed
+    capacity. If ``time_limit``, ``node_limit`` or a cancelled ``control``
+    stops the search, the best fleet found so far is returned with
+    ``optimal=False``.
+    """
+    from . import solve
+
+    values, weights, capacities = _validate_fleet(values, weights, capacities)
+    heuristic = solve_fleet_greedy(values, weights, capacities)
+
+    free, items = density_order(values, weights, max(capacities))
+    v = [values[i] for i in items]
+    w = [weights[i] for i in items]
+    m = len(items)
+    free_value = sum(values[i] for i in free)
+
+    surrogate = solve(v, w, sum(capacities)).total_value + free_value
+    if heuristic.total_value >= surrogate:
+        return _fleet_result(heuristic.assignments, values, weights, capacities, "branch_and_bound")
+
+    bound = suffix_bound(v, w)
+
+    # Values below exclude the zero-weight items, which always ride on vehicle 0
+    best_val = heuristic.total_value - free_value
+    best_path = None
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    nodes = 0
+    stopped = False
+    # Each node is (next item, remaining capacity per vehicle, value so far,
+    # (item, vehicle) assignments as a cons list)
+    stack = [(0, tuple(capacities), 0, None)]
+    with phase(metrics, "search"):
+        while stack:
+            nodes += 1
+            if node_limit is not None and nodes > node_limit:
+                stopped = True
+                break
+            if search_stopped(nodes, deadline, control):
+                stopped = True
+                break
+
+            k, caps, val, path = stack.pop()
+            if val > best_val:
+                best_val, best_path = val, path
+            if k == m or bound(k, sum(caps), val) <= best_val:
+                continue
+
+            stack.append((k + 1, caps, val, path))
+            seen = set()
+            # Tightest fitting vehicle is pushed last so it is explored first
+            for vehicle in sorted(range(len(caps)), key=lambda j: caps[j], reverse=True):
+                if w[k] > caps[vehicle] or caps[vehicle] in seen:
+                    continue
+                seen.add(caps[vehicle])
+                new_caps = caps[:vehicle] + (caps[vehicle] - w[k],) + caps[vehicle + 1:]
+                stack.append((k + 1, new_caps, val + v[k], ((k, vehicle), path)))
+    if metrics is not None:
+        metrics.count("search", cells=nodes)
+
+    if best_path is None:
+        # The greedy start may hold the zero-weight items on any vehicle
+        free_items = set(free)
+        assignments = [[i for i in items if i not in free_items] for items in heuristic.assignments]
+        assignments[0].extend(free)
+    else:
+        assignments = [[] for _ in capacities]
+        assignments[0].extend(free)
+        while best_path is not None:
+            (k, vehicle), best_path = best_path
+            assignments[vehicle].append(items[k])
+
+    if not stopped:
+        return _fleet_result(assignments, values, weights, capacities, "branch_and_bound")
+    open_bound = max((bound(k, sum(caps), val) for k, caps, val, _ in stack), default=0)
+    upper_bound = min(surrogate, free_value + max(best_val, open_bound))
+    return _fleet_result(assignments, values, weights, capacities, "branch_and_bound",
+                         optimal=False, upper_bound=upper_bound)
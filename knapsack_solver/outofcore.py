@@ -0,0 +1,70 @@
+"""DP whose decision table lives in a memory-mapped file instead of RAM."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+from .vectorized import backtrack_keep, fill_keep_table, keep_table_bytes, solve_bitset
+
+# RAM an in-memory bit-packed solve may use before its table is moved to disk
+MEMORY_BUDGET = 1 << 30
+
+
+@contextmanager
+def disk_keep_table(rows, row_bytes, directory=None):
+    """A zero-filled ``(rows, row_bytes)`` :class:`numpy.memmap` in a temporary file.
+
+    The file goes in ``directory`` (default: the system temp directory) and
+    is removed when the ``with`` block ends, also when it raises.
+    """
+    fd, path = tempfile.mkstemp(prefix="knapsack-", suffix=".keep", dir=directory)
+    os.close(fd)
+    keep = None
+    try:
+        # A fresh file reads as zeros, which is what the table fills expect
+        keep = np.memmap(path, dtype=np.uint8, mode="w+", shape=(rows, row_bytes))
+        yield keep
+    finally:
+        # Drop the mapping before removing the file, which Windows requires
+        keep = None
+        os.remove(path)
+
+
+def solve_memmap(values, weights, capacity, memory_budget=None, directory=None, control=None, metrics=None):
+    """Bit-packed 0/1 knapsack with the keep table in a :class:`numpy.memmap`.
+
+    Each item's decision row is written to a temporary file as it is
+    computed, and the file is flushed whenever another ``memory_budget``
+    bytes of rows have been written, so the table costs disk space rather
+    than RAM. The backtrack then reads back one row per item, last to
+    first. Only the value row (``8 * capacity`` bytes) stays in memory.
+    The file goes in ``directory`` (default: the system temp directory)
+    and is removed afterwards, also when the solve fails or is cancelled.
+
+    ``memory_budget`` defaults to :data:`MEMORY_BUDGET`; tables that fit in
+    it are solved by :func:`solve_bitset` in memory. Picks the same items
+    as :func:`solve_dp`.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+    budget = MEMORY_BUDGET if memory_budget is None else int(memory_budget)
+    if budget <= 0:
+        raise ValueError(f"memory_budget must be positive, got {memory_budget}")
+    table_bytes = keep_table_bytes(n, capacity, packed=True)
+    if table_bytes <= budget:
+        return solve_bitset(values, weights, capacity, control=control, metrics=metrics)
+
+    row_bytes = (capacity + 8) // 8
+    with disk_keep_table(n, row_bytes, directory) as keep:
+        with phase(metrics, "table fill", n * (capacity + 1), 8 * (capacity + 1) + budget):
+            fill_keep_table(values, weights, capacity, packed=True, control=control,
+                            keep=keep, flush_every=max(1, budget // row_bytes))
+            keep.flush()
+        with phase(metrics, "backtrack", n):
+            chosen = backtrack_keep(keep, weights, capacity, packed=True)
+
+    return build_result(chosen, values, weights, capacity, "memmap")
@@ -0,0 +1,134 @@
+"""Multi-process DP for one large instance, split along the capacity axis."""
+
+import multiprocessing
+import os
+from multiprocessing.shared_memory import SharedMemory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+from .vectorized import backtrack_keep, solve_bitset
+
+# Columns per worker are a multiple of this, so no two workers write the
+# same keep-table byte and their row slices do not share cache lines.
+COLUMN_ALIGN = 512
+
+# Below this many columns per worker, process start-up costs more than it saves
+MIN_WORKER_COLUMNS = 64 * 1024
+
+# Seconds between progress and cancellation checks while the workers fill rows
+_POLL_INTERVAL = 0.05
+
+
+def _fill_columns(rows_name, keep_name, capacity, values, weights, lo, hi, barrier, rows_done, first):
+    # Worker process: fill columns [lo, hi) of every row, one barrier per item
+    rows_shm = SharedMemory(name=rows_name)
+    keep_shm = SharedMemory(name=keep_name)
+    n = len(values)
+    rows = np.ndarray((2, capacity + 1), dtype=np.int64, buffer=rows_shm.buf)
+    keep = np.ndarray((n, (capacity + 8) // 8), dtype=np.uint8, buffer=keep_shm.buf)
+    take = np.zeros(hi - lo, dtype=bool)
+    try:
+        for i in range(n):
+            # Row i is read from one buffer and written to the other, so
+            # neighbouring chunks can still read the previous row
+            prev, cur = rows[i % 2], rows[(i + 1) % 2]
+            wt, v = weights[i], values[i]
+            start = min(max(lo, wt), hi)
+            cur[lo:start] = prev[lo:start]
+            if start < hi:
+                shifted = prev[start - wt:hi - wt] + v
+                take[:start - lo] = False
+                take[start - lo:] = shifted > prev[start:hi]
+                np.maximum(prev[start:hi], shifted, out=cur[start:hi])
+                keep[i, lo >> 3:(hi + 7) >> 3] = np.packbits(take)
+            barrier.wait()
+            if first:
+                rows_done.value = i + 1
+    except BrokenBarrierError:
+        pass
+    finally:
+        del rows, keep
+        rows_shm.close()
+        keep_shm.close()
+
+
+def column_chunks(capacity, workers):
+    """Split ``0..capacity`` into at most ``workers`` aligned ``(lo, hi)`` ranges."""
+    step = -(-(capacity + 1) // workers)
+    step = -(-step // COLUMN_ALIGN) * COLUMN_ALIGN
+    return [(lo, min(lo + step, capacity + 1)) for lo in range(0, capacity + 1, step)]
+
+
+def solve_parallel(values, weights, capacity, workers=None, control=None, metrics=None):
+    """Row-by-row 0/1 knapsack with the capacity axis split across worker processes.
+
+    The two value rows and the bit-packed keep table live in
+    :mod:`multiprocessing.shared_memory`; each worker owns a fixed column
+    range, so a row is filled with no copying or pickling and the workers
+    only meet at a barrier after every item. The backtrack then reads the
+    shared keep table, giving the same items as :func:`solve_dp`. The
+    table needs ``n * capacity / 8`` bytes of ``/dev/shm``.
+
+    ``workers`` defaults to the CPU count. Instances too small to give each
+    worker :data:`MIN_WORKER_COLUMNS` columns, and calls from a daemonic
+    process (which may not start children), are solved by
+    :func:`solve_bitset` in this process.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+    workers = min(workers or os.cpu_count() or 1, (capacity + 1) // MIN_WORKER_COLUMNS)
+    if workers < 2 or n == 0 or multiprocessing.current_process().daemon:
+        return solve_bitset(values, weights, capacity, control=control, metrics=metrics)
+
+    chunks = column_chunks(capacity, workers)
+    keep_bytes = n * ((capacity + 8) // 8)
+    # Spawned, not forked: the caller may be a threaded server
+    context = multiprocessing.get_context("spawn")
+    rows_shm = SharedMemory(create=True, size=2 * 8 * (capacity + 1))
+    keep_shm = SharedMemory(create=True, size=keep_bytes)
+    barrier = context.Barrier(len(chunks))
+    rows_done = context.Value("q", 0, lock=False)
+    processes = []
+    try:
+        with phase(metrics, "table fill", n * (capacity + 1), keep_bytes + rows_shm.size):
+            np.ndarray((2, capacity + 1), dtype=np.int64, buffer=rows_shm.buf)[0] = 0
+            for k, (lo, hi) in enumerate(chunks):
+                process = context.Process(
+                    target=_fill_columns,
+                    args=(rows_shm.name, keep_shm.name, capacity, values, weights, lo, hi,
+                          barrier, rows_done, k == 0),
+                    daemon=True,
+                )
+                process.start()
+                processes.append(process)
+
+            if control is not None:
+                control.start(n)
+            while any(process.is_alive() for process in processes):
+                processes[0].join(_POLL_INTERVAL)
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise RuntimeError("a parallel DP worker exited unexpectedly")
+                if control is not None:
+                    control.advance(rows_done.value - control.done)
+            if rows_done.value != n:
+                raise RuntimeError("parallel DP workers stopped before the last row")
+
+        with phase(metrics, "backtrack", n):
+            keep = np.ndarray((n, (capacity + 8) // 8), dtype=np.uint8, buffer=keep_shm.buf)
+            chosen = backtrack_keep(keep, weights, capacity, packed=True)
+            del keep
+    finally:
+        # Wakes any worker still waiting so it can exit
+        barrier.abort()
+        for process in processes:
+            process.join(1.0)
+            if process.is_alive():
+                process.terminate()
+        for shm in (rows_shm, keep_shm):
+            shm.close()
+            shm.unlink()
+
+    return build_result(chosen, values, weights, capacity, "parallel")
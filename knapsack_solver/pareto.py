@@ -0,0 +1,90 @@
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+
+# Frontier size at which the merge stops paying off against the dense row
+# update, as a fraction of the capacity axis.
+FRONTIER_FALLBACK_RATIO = 32
+
+
+def solve_pareto(values, weights, capacity, max_frontier=None, control=None, metrics=None):
+    """Sparse Nemhauser-Ullmann DP over the Pareto frontier of (weight, value) states.
+
+    After each item only the undominated states survive: sorted by weight,
+    each one worth strictly more than every lighter state. Each item merges
+    the frontier with a shifted copy of itself, so the cost depends on the
+    frontier size rather than on ``capacity``. Every surviving state keeps
+    a link to its predecessor for reconstruction.
+
+    If the frontier grows past ``max_frontier`` (by default 1/32 of the
+    capacity axis, at least 4,096), the dense DP is cheaper and is used
+    instead. The ``table fill`` phase of ``metrics`` counts merged states
+    as its cells and the stored predecessor links as its table bytes.
+    """
+    from . import SOLVERS, choose_method
+
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    if max_frontier is None:
+        max_frontier = max(4096, (capacity + 1) // FRONTIER_FALLBACK_RATIO)
+
+    frontier_w = np.zeros(1, dtype=np.int64)
+    frontier_v = np.zeros(1, dtype=np.int64)
+    # Per item: for every surviving state, its predecessor's position and whether the item was taken
+    parents, takes = [], []
+    merged = stored_bytes = 0
+
+    with phase(metrics, "table fill"):
+        if control is not None:
+            control.start(len(values))
+        for i in range(len(values)):
+            if control is not None:
+                control.advance()
+            v, wt = values[i], weights[i]
+            if v <= 0 or wt > capacity:
+                parents.append(None)
+                takes.append(None)
+                continue
+            fits = int(np.searchsorted(frontier_w, capacity - wt, side="right"))
+            cand_w = np.concatenate((frontier_w, frontier_w[:fits] + wt))
+            cand_v = np.concatenate((frontier_v, frontier_v[:fits] + v))
+            source = np.concatenate((np.arange(len(frontier_w)), np.arange(fits)))
+            taken = np.zeros(len(cand_w), dtype=bool)
+            taken[len(frontier_w):] = True
+
+            # Lighter first, then more valuable; keep a state only if it beats every lighter one
+            order = np.lexsort((-cand_v, cand_w))
+            cand_v = cand_v[order]
+            best_before = np.maximum.accumulate(cand_v)
+            keep = np.ones(len(order), dtype=bool)
+            keep[1:] = cand_v[1:] > best_before[:-1]
+
+            order = order[keep]
+            frontier_w = cand_w[order]
+            frontier_v = cand_v[keep]
+            parents.append(source[order])
+            takes.append(taken[order])
+            merged += len(cand_w)
+            stored_bytes += parents[-1].nbytes + takes[-1].nbytes
+
+            if len(frontier_w) > max_frontier:
+                break
+    if metrics is not None:
+        metrics.count("table fill", merged, stored_bytes)
+
+    if len(frontier_w) > max_frontier:
+        dense = SOLVERS[choose_method(values, weights, capacity)]
+        return dense(values, weights, capacity, control=control, metrics=metrics)
+
+    with phase(metrics, "backtrack", len(values)):
+        # The heaviest state on the frontier is also the most valuable
+        state = len(frontier_w) - 1
+        chosen = []
+        for i in range(len(values) - 1, -1, -1):
+            if parents[i] is None:
+                continue
+            if takes[i][state]:
+                chosen.append(i)
+            state = parents[i][state]
+        chosen.reverse()
+    return build_result(chosen, values, weights, capacity, "pareto")
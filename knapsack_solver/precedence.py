@@ -0,0 +1,185 @@
+import heapq
+from dataclasses import replace
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+from .vectorized import PACKED_CELL_THRESHOLD, keep_table_bytes
+
+# Conflict-search nodes tried before the best plan found so far is returned
+CONFLICT_NODE_LIMIT = 200
+
+
+def preorder(prerequisites):
+    """Depth-first order of a prerequisite forest and where each subtree ends.
+
+    ``prerequisites[i]`` is the index of the item that must be taken before
+    item ``i``, or ``None`` (or ``-1``) for an item without one. Returns
+    ``(order, end)``: the subtree of ``order[p]`` fills positions
+    ``p .. end[p] - 1``. Raises ``ValueError`` for an unknown index or a
+    cycle.
+    """
+    n = len(prerequisites)
+    children = [[] for _ in range(n)]
+    roots = []
+    for i, parent in enumerate(prerequisites):
+        if parent is None or parent == -1:
+            roots.append(i)
+        elif not 0 <= parent < n or parent == i:
+            raise ValueError(f"item {i} has an invalid prerequisite {parent}")
+        else:
+            children[parent].append(i)
+
+    order, end = [], [0] * n
+    # A negative entry marks the subtree starting at position ~entry as finished
+    stack = list(reversed(roots))
+    while stack:
+        entry = stack.pop()
+        if entry < 0:
+            end[~entry] = len(order)
+            continue
+        stack.append(~len(order))
+        order.append(entry)
+        stack.extend(reversed(children[entry]))
+    if len(order) != n:
+        raise ValueError("prerequisites contain a cycle")
+    return order, end
+
+
+def _fill_forest(values, weights, capacity, order, end, banned):
+    # f[p][w]: best value from positions p.. with capacity w. Skipping order[p]
+    # also skips its subtree, so f[p] = max(f[end[p]], v + f[p + 1] shifted).
+    n = len(order)
+    packed = n * (capacity + 1) > PACKED_CELL_THRESHOLD
+    keep = np.zeros((n, (capacity + 8) // 8 if packed else capacity + 1), dtype=np.uint8)
+    # Rows are kept only until the last position that reads them
+    readers = {}
+    for p in range(n):
+        readers[p + 1] = readers.get(p + 1, 0) + 1
+        readers[end[p]] = readers.get(end[p], 0) + 1
+    rows = {n: np.zeros(capacity + 1, dtype=np.int64)}
+    take = np.zeros(capacity + 1, dtype=bool)
+    for p in range(n - 1, -1, -1):
+        i = order[p]
+        below, skip = rows[p + 1], rows[end[p]]
+        row = skip.copy()
+        wt, v = weights[i], values[i]
+        take[:] = False
+        if not banned[i] and wt <= capacity:
+            shifted = below[:capacity + 1 - wt] + v
+            # Strictly better only, so on a tie the item is skipped
+            take[wt:] = shifted > skip[wt:]
+            np.maximum(skip[wt:], shifted, out=row[wt:])
+        keep[p] = np.packbits(take) if packed else take
+        for q in (p + 1, end[p]):
+            readers[q] -= 1
+            if not readers[q]:
+                del rows[q]
+        rows[p] = row
+
+    chosen, p, w = [], 0, capacity
+    while p < n:
+        bit = keep[p, w >> 3] >> (7 - (w & 7)) & 1 if packed else keep[p, w]
+        if bit:
+            chosen.append(order[p])
+            w -= weights[order[p]]
+            p += 1
+        else:
+            p = end[p]
+    return int(rows[0][capacity]), sorted(chosen)
+
+
+def _first_clash(plan, conflicts):
+    taken = set(plan)
+    return next(((a, b) for a, b in conflicts if a in taken and b in taken), None)
+
+
+def _repair(plan, values, conflicts, order, end, position):
+    # Drop the cheaper item of every clash, with everything that needs it
+    taken = set(plan)
+    for a, b in conflicts:
+        if a in taken and b in taken:
+            drop = a if values[a] <= values[b] else b
+            taken.difference_update(order[position[drop]:end[position[drop]]])
+    return sorted(taken)
+
+
+def solve_prerequisites(values, weights, capacity, prerequisites, conflicts=(), node_limit=CONFLICT_NODE_LIMIT,
+                        control=None, metrics=None):
+    """0/1 knapsack where items need their prerequisite and some pairs clash.
+
+    ``prerequisites[i]`` is the item that must also be taken for item ``i``
+    to be taken, or ``None``; the links must form a forest. ``conflicts``
+    lists ``(a, b)`` pairs that may not both be taken.
+
+    The forest is solved with the tree-knapsack DP over its depth-first
+    order: skipping an item jumps past its whole subtree, so each item
+    costs one vectorized row and the table is O(n * capacity), like the
+    plain DP. Conflicts are then handled by best-first branching: the DP
+    without conflicts is an upper bound, and a plan that takes both items
+    of a pair is split into one branch with each item banned. Dropping the
+    cheaper item of every clash turns each plan into a conflict-free
+    incumbent, and branches that cannot beat it are cut. After
+    ``node_limit`` branches, or when ``control`` is stopped, the incumbent
+    is returned with ``optimal=False`` and the remaining ``upper_bound``.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+    if len(prerequisites) != n:
+        raise ValueError(f"got {len(prerequisites)} prerequisites for {n} items")
+    conflicts = [(int(a), int(b)) for a, b in conflicts]
+    if any(not (0 <= a < n and 0 <= b < n) or a == b for a, b in conflicts):
+        raise ValueError("conflicts must be pairs of two different item indices")
+    order, end = preorder(prerequisites)
+    position = {item: p for p, item in enumerate(order)}
+    table_bytes = keep_table_bytes(n, capacity, packed=n * (capacity + 1) > PACKED_CELL_THRESHOLD)
+
+    def solve_node(banned):
+        with phase(metrics, "table fill", n * (capacity + 1), table_bytes):
+            return _fill_forest(values, weights, capacity, order, end, banned)
+
+    if control is not None:
+        control.start(1)
+    no_bans = np.zeros(n, dtype=bool)
+    value, chosen = solve_node(no_bans)
+    if control is not None:
+        control.advance()
+
+    # Max-heap on each node's DP value, which bounds every plan below it
+    heap = [(-value, 0, chosen, no_bans)]
+    seen = {no_bans.tobytes()}
+    best, best_value, nodes = [], 0, 0
+    with phase(metrics, "search"):
+        while heap and -heap[0][0] > best_value:
+            bound, tie, chosen, banned = heapq.heappop(heap)
+            clash = _first_clash(chosen, conflicts)
+            if clash is None:
+                # No open branch can beat the best bound, so this plan is optimal
+                best, best_value = chosen, -bound
+                break
+            repaired = _repair(chosen, values, conflicts, order, end, position)
+            repaired_value = sum(values[i] for i in repaired)
+            if repaired_value > best_value:
+                best, best_value = repaired, repaired_value
+            if nodes >= node_limit or (control is not None and control.should_stop()):
+                heapq.heappush(heap, (bound, tie, chosen, banned))
+                break
+            nodes += 1
+            for item in clash:
+                child = banned.copy()
+                child[item] = True
+                if child.tobytes() in seen:
+                    continue
+                seen.add(child.tobytes())
+                value, plan = solve_node(child)
+                if value > best_value:
+                    heapq.heappush(heap, (-value, len(seen), plan, child))
+    if metrics is not None:
+        metrics.count("search", cells=nodes)
+
+    result = build_result(best, values, weights, capacity, "prerequisites")
+    upper = max(best_value, -heap[0][0]) if heap else best_value
+    if upper == best_value:
+        return result
+    return replace(result, optimal=False, upper_bound=upper)
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .dp import validate_arrays
+from .result import KnapsackResult
+
+
+@dataclass(frozen=True)
+class Reduction:
+    """A smaller instance equivalent to the original, plus the map back.
+
+    Every step is exact: the reduced DP makes the same take/skip decision
+    for each kept item as the original DP, so :meth:`expand` returns the
+    same item set the unreduced solve would have.
+    """
+
+    kept: tuple
+    forced: tuple
+    values: list
+    weights: list
+    capacity: int
+    scale: int
+    items_before: int
+    capacity_before: int
+
+    @property
+    def cells_before(self):
+        return self.items_before * (self.capacity_before + 1)
+
+    @property
+    def cells_after(self):
+        return len(self.kept) * (self.capacity + 1)
+
+    @property
+    def shrink_factor(self):
+        return self.cells_before / max(self.cells_after, 1)
+
+    def summary(self):
+        return {
+            "items_before": self.items_before,
+            "items_after": len(self.kept),
+            "items_forced": len(self.forced),
+            "weight_scale": self.scale,
+            "capacity_before": self.capacity_before,
+            "capacity_after": self.capacity,
+            "cells_before": self.cells_before,
+            "cells_after": self.cells_after,
+            "shrink_factor": self.shrink_factor,
+        }
+
+    def expand(self, result, values, weights):
+        """Map a result on the reduced instance back onto the original items."""
+        values = np.asarray(values, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.int64)
+        chosen = sorted([self.kept[i] for i in result.chosen] + list(self.forced))
+        index = np.asarray(chosen, dtype=np.intp)
+        forced_value = int(values[np.asarray(self.forced, dtype=np.intp)].sum())
+        upper_bound = None if result.upper_bound is None else result.upper_bound + forced_value
+        return KnapsackResult(
+            chosen=tuple(chosen),
+            total_value=int(values[index].sum()),
+            total_weight=int(weights[index].sum()),
+            capacity=self.capacity_before,
+            method=result.method,
+            optimal=result.optimal,
+            upper_bound=upper_bound,
+            preprocess=self.summary(),
+        )
+
+
+def reduce_instance(values, weights, capacity):
+    """Shrink an instance before any solver sees it.
+
+    * items that cannot fit, or add no value, are dropped;
+    * if the remaining items weigh at most the capacity, all of them are
+      taken and nothing is solved (this is where the capacity would be
+      clipped to the total weight, which leaves no DP at all);
+    * weights and capacity are divided by the GCD of the weights.
+
+    The filtering runs on NumPy arrays, so only the kept items are ever
+    turned into Python ints.
+    """
+    values, weights, capacity = validate_arrays(values, weights, capacity)
+    kept = np.flatnonzero((values > 0) & (weights <= capacity))
+    total_weight = int(weights[kept].sum())
+
+    forced, reduced_capacity = kept[:0], capacity
+    if total_weight <= capacity:
+        forced, kept, reduced_capacity = kept, kept[:0], 0
+
+    scale = int(np.gcd.reduce(weights[kept])) if len(kept) else 0
+    scale = scale or 1
+    return Reduction(
+        kept=tuple(kept.tolist()),
+        forced=tuple(forced.tolist()),
+        values=values[kept].tolist(),
+        weights=(weights[kept] // scale).tolist(),
+        capacity=reduced_capacity // scale,
+        scale=scale,
+        items_before=len(values),
+        capacity_before=capacity,
+    )
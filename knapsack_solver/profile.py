@@ -0,0 +1,95 @@
+import numpy as np
+
+from .dp import build_result, validate_arrays, validate_instance
+from .metrics import phase
+from .value_dp import _UNREACHABLE
+from .vectorized import PACKED_CELL_THRESHOLD, backtrack_keep, fill_keep_table, keep_table_bytes
+
+
+class CapacityProfile:
+    """Every capacity ``0..max_capacity`` answered from one DP pass.
+
+    The last DP row is the value-vs-capacity curve, and the keep table does
+    not depend on the capacity we backtrack from, so any capacity can be
+    turned into an item set without solving again.
+    """
+
+    def __init__(self, values, weights, max_capacity, best_values, keep, packed):
+        self.item_values = values
+        self.item_weights = weights
+        self.max_capacity = max_capacity
+        self.values = best_values
+        self._keep = keep
+        self._packed = packed
+
+    def best_value(self, capacity):
+        return int(self.values[self._check_capacity(capacity)])
+
+    def select(self, capacity):
+        """The :class:`KnapsackResult` that :func:`knapsack_solver.solve` would give for ``capacity``."""
+        capacity = self._check_capacity(capacity)
+        chosen = backtrack_keep(self._keep, self.item_weights, capacity, packed=self._packed)
+        return build_result(chosen, self.item_values, self.item_weights, capacity, "profile")
+
+    def _check_capacity(self, capacity):
+        capacity = int(capacity)
+        if not 0 <= capacity <= self.max_capacity:
+            raise ValueError(f"capacity must be between 0 and {self.max_capacity}, got {capacity}")
+        return capacity
+
+
+def solve_profile(values, weights, max_capacity, control=None, metrics=None):
+    """Run the row-vectorized DP once and keep the answers for every capacity."""
+    values, weights, max_capacity = validate_instance(values, weights, max_capacity)
+    n = len(values)
+    packed = n * (max_capacity + 1) > PACKED_CELL_THRESHOLD
+    with phase(metrics, "table fill", n * (max_capacity + 1), keep_table_bytes(n, max_capacity, packed)):
+        row, keep = fill_keep_table(values, weights, max_capacity, packed=packed, control=control)
+    row.flags.writeable = False
+    return CapacityProfile(values, weights, max_capacity, row, keep, packed)
+
+
+def profile_values(values, weights, capacities, control=None, metrics=None):
+    """Best total value for each capacity in ``capacities``, without any item sets.
+
+    Only one DP row is kept, so this needs no keep table, and the DP runs
+    over the shorter axis after dropping useless items and dividing the
+    weights by their GCD. Over the value axis, ``row[v]`` is the least
+    weight reaching value ``v``, and the best value within capacity ``c``
+    is the largest ``v`` whose suffix minimum of ``row`` is at most ``c``.
+    Returns an ``int64`` array aligned with ``capacities``.
+    """
+    values, weights, _ = validate_arrays(values, weights, 0)
+    capacities = np.asarray(capacities, dtype=np.int64)
+    if (capacities < 0).any():
+        raise ValueError("capacities must be non-negative")
+    max_capacity = int(capacities.max(initial=0))
+    useful = (values > 0) & (weights <= max_capacity)
+    values, weights = values[useful], weights[useful]
+    scale = int(np.gcd.reduce(weights)) if len(weights) else 0
+    scale = scale or 1
+    weights = weights // scale
+    axis = max_capacity // scale
+    total = int(values.sum())
+
+    if control is not None:
+        control.start(len(values))
+    if total < axis:
+        with phase(metrics, "table fill", len(values) * (total + 1), 8 * (total + 1)):
+            row = np.full(total + 1, _UNREACHABLE, dtype=np.int64)
+            row[0] = 0
+            for v, wt in zip(values.tolist(), weights.tolist()):
+                if control is not None:
+                    control.advance()
+                np.minimum(row[v:], row[:total + 1 - v] + wt, out=row[v:])
+            # Least weight reaching at least each value; non-decreasing, so searchable
+            least = np.minimum.accumulate(row[::-1])[::-1]
+            return np.searchsorted(least, capacities // scale, side="right") - 1
+
+    with phase(metrics, "table fill", len(values) * (axis + 1), 8 * (axis + 1)):
+        row = np.zeros(axis + 1, dtype=np.int64)
+        for v, wt in zip(values.tolist(), weights.tolist()):
+            if control is not None:
+                control.advance()
+            np.maximum(row[wt:], row[:axis + 1 - wt] + v, out=row[wt:])
+        return row[capacities // scale]
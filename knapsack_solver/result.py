@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class KnapsackResult:
+    """Outcome of a single knapsack solve.
+
+    ``chosen`` holds the zero-based indices of the selected items in
+    ascending order, so callers can map them back onto their own names,
+    packages or courses. Exact modes leave ``optimal`` set; modes that stop
+    early report the best known ``upper_bound`` on the optimum instead.
+    ``counts`` is set by bounded solves and gives how many copies of each
+    chosen item to take, and ``usage`` holds per-resource totals for
+    multi-constraint solves. ``preprocess`` summarizes how much the reduction
+    pass shrank the table.
+    """
+
+    chosen: tuple
+    total_value: int
+    total_weight: int
+    capacity: int
+    method: str = "dp"
+    optimal: bool = True
+    upper_bound: int = None
+    counts: tuple = None
+    usage: tuple = None
+    preprocess: dict = field(default=None, compare=False)
+
+    @property
+    def is_empty(self):
+        return not self.chosen
+
+    @property
+    def gap(self):
+        """Relative distance to the upper bound, ``0.0`` when proven optimal."""
+        if self.optimal or self.upper_bound is None or self.upper_bound <= 0:
+            return 0.0
+        return (self.upper_bound - self.total_value) / self.upper_bound
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    """Outcome of loading several vehicles at once (multiple knapsack).
+
+    ``assignments[k]`` lists the item indices loaded onto vehicle ``k``,
+    whose capacity is ``capacities[k]``; every item is used at most once.
+    """
+
+    assignments: tuple
+    capacities: tuple
+    loads: tuple
+    total_value: int
+    method: str = "branch_and_bound"
+    optimal: bool = True
+    upper_bound: int = None
+
+    @property
+    def chosen(self):
+        return tuple(sorted(i for items in self.assignments for i in items))
+
+    @property
+    def gap(self):
+        if self.optimal or self.upper_bound is None or self.upper_bound <= 0:
+            return 0.0
+        return (self.upper_bound - self.total_value) / self.upper_bound
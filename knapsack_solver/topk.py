@@ -0,0 +1,79 @@
+from dataclasses import replace
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+
+# Marks an empty slot in a k-best list; far enough from the int64 limits to negate safely
+MISSING = np.iinfo(np.int64).min // 4
+
+# Largest ``items * (capacity + 1) * k`` table :func:`solve_top_k` will build
+TOP_K_CELL_LIMIT = 2 * 10**8
+
+
+def solve_top_k(values, weights, capacity, k=3, max_cells=TOP_K_CELL_LIMIT, control=None, metrics=None):
+    """The ``k`` most valuable distinct item sets, best first, from one DP pass.
+
+    Every capacity cell holds a sorted list of the ``k`` best values
+    reachable with the items so far, and each entry remembers which entry
+    of the previous row it came from and whether the item was taken. A
+    cell's "skip" and "take" candidates are different item sets, so the
+    lists never repeat a set and the ``k`` backtracks give ``k`` distinct
+    answers. The work is O(n * capacity * k log k), with one byte of back
+    pointer per entry.
+
+    Items worth nothing are left out, so an alternative is never just
+    another set with a worthless item added. The first result is the one
+    :func:`solve_dp` picks. Each result's ``upper_bound`` is the optimum and
+    ``optimal`` says whether it ties with it. Fewer than ``k`` results
+    come back when there are fewer item sets. Raises ``ValueError`` if the
+    table would exceed ``max_cells`` entries.
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    items = [i for i in range(len(values)) if values[i] > 0 and weights[i] <= capacity]
+    cells = len(items) * (capacity + 1) * k
+    if cells > max_cells:
+        raise ValueError(f"listing {k} alternatives needs {cells:,} table entries, more than the limit of {max_cells:,}")
+
+    # Entry r of row[w]: the r-th best value within capacity w; source says where it came from
+    row = np.full((capacity + 1, k), MISSING, dtype=np.int64)
+    row[:, 0] = 0
+    source = np.zeros((len(items), capacity + 1, k), dtype=np.uint8 if 2 * k <= 256 else np.uint16)
+    with phase(metrics, "table fill", cells, source.nbytes + 3 * row.nbytes):
+        if control is not None:
+            control.start(len(items))
+        for step, i in enumerate(items):
+            if control is not None:
+                control.advance()
+            wt, v = weights[i], values[i]
+            taken = np.full_like(row, MISSING)
+            shifted = row[:capacity + 1 - wt]
+            taken[wt:] = np.where(shifted == MISSING, MISSING, shifted + v)
+            candidates = np.concatenate((row, taken), axis=1)
+            # Stable, so on a tie skipping the item wins, as in solve_dp
+            order = np.argsort(-candidates, axis=1, kind="stable")[:, :k]
+            row = np.take_along_axis(candidates, order, axis=1)
+            source[step] = order
+
+    results = []
+    with phase(metrics, "backtrack", len(items) * k):
+        for rank in range(k):
+            if row[capacity, rank] == MISSING:
+                break
+            w, r, chosen = capacity, rank, []
+            for step in range(len(items) - 1, -1, -1):
+                s = int(source[step, w, r])
+                if s >= k:
+                    chosen.append(items[step])
+                    w -= weights[items[step]]
+                    r = s - k
+                else:
+                    r = s
+            chosen.reverse()
+            results.append(build_result(chosen, values, weights, capacity, "top_k"))
+
+    best = results[0].total_value
+    return tuple(replace(r, optimal=r.total_value == best, upper_bound=best) for r in results)
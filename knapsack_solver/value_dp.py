@@ -0,0 +1,90 @@
+from contextlib import ExitStack
+
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+from .outofcore import MEMORY_BUDGET, disk_keep_table
+from .vectorized import PACKED_CELL_THRESHOLD, keep_table_bytes
+
+_UNREACHABLE = np.iinfo(np.int64).max // 2
+
+
+def value_axis_size(values, weights, capacity):
+    """Largest total value the value-indexed DP has to cover."""
+    return sum(v for v, w in zip(values, weights) if v > 0 and w <= capacity)
+
+
+def solve_by_value(values, weights, capacity, memory_budget=None, directory=None, control=None, metrics=None):
+    """0/1 knapsack as the dual DP over total value.
+
+    ``row[v]`` is the minimum weight that reaches value exactly ``v``, so
+    the work is O(n * total_value) and independent of ``capacity``. The
+    optimum is the largest ``v`` with ``row[v] <= capacity``. When several
+    item sets share that optimum this mode may return a different one than
+    the weight-indexed solvers.
+
+    If the keep table would exceed ``memory_budget`` bytes (default
+    :data:`MEMORY_BUDGET`) it is bit-packed into a temporary file in
+    ``directory``, as :func:`solve_memmap` does for the weight axis.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    budget = MEMORY_BUDGET if memory_budget is None else int(memory_budget)
+    if budget <= 0:
+        raise ValueError(f"memory_budget must be positive, got {memory_budget}")
+    # Items that cannot fit or add no value never change the optimum
+    items = [i for i in range(len(values)) if values[i] > 0 and weights[i] <= capacity]
+    total = sum(values[i] for i in items)
+
+    m = len(items)
+    on_disk = keep_table_bytes(m, total, packed=True) > budget
+    packed = (on_disk or m * (total + 1) > PACKED_CELL_THRESHOLD
+              or keep_table_bytes(m, total) > budget)
+    row_bytes = (total + 8) // 8 if packed else total + 1
+    with ExitStack() as stack:
+        if on_disk:
+            keep = stack.enter_context(disk_keep_table(m, row_bytes, directory))
+            table_bytes = 8 * (total + 1) + budget
+        else:
+            keep = np.zeros((m, row_bytes), dtype=np.uint8 if packed else bool)
+            table_bytes = keep_table_bytes(m, total, packed)
+        with phase(metrics, "table fill", m * (total + 1), table_bytes):
+            row = np.full(total + 1, _UNREACHABLE, dtype=np.int64)
+            row[0] = 0
+            if packed:
+                take_row = np.zeros(total + 1, dtype=bool)
+
+            if control is not None:
+                control.start(m)
+            for k, i in enumerate(items):
+                if control is not None:
+                    control.advance()
+                if on_disk and k and k % max(1, budget // row_bytes) == 0:
+                    keep.flush()
+                v, wt = values[i], weights[i]
+                shifted = row[:total + 1 - v] + wt
+                take = shifted < row[v:]
+                if packed:
+                    take_row[:v] = False
+                    take_row[v:] = take
+                    keep[k] = np.packbits(take_row)
+                else:
+                    keep[k, v:] = take
+                np.minimum(row[v:], shifted, out=row[v:])
+
+        with phase(metrics, "backtrack", m):
+            best = int(np.flatnonzero(row <= capacity)[-1])
+
+            # Backtrack along the value axis
+            v = best
+            chosen = []
+            for k in range(m - 1, -1, -1):
+                if packed:
+                    taken = (keep[k, v >> 3] >> (7 - (v & 7))) & 1
+                else:
+                    taken = keep[k, v]
+                if taken:
+                    chosen.append(items[k])
+                    v -= values[items[k]]
+            chosen.reverse()
+    return build_result(chosen, values, weights, capacity, "value")
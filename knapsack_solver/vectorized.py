@@ -0,0 +1,102 @@
+import numpy as np
+
+from .dp import build_result, validate_instance
+from .metrics import phase
+
+# Above this many keep-table cells ``solve(method="auto")`` stores one bit
+# per cell instead of one byte.
+PACKED_CELL_THRESHOLD = 64 * 1024 * 1024
+
+
+def keep_table_bytes(n, capacity, packed=False):
+    """Bytes of the keep table plus the one live value row."""
+    row_bytes = (capacity + 8) // 8 if packed else capacity + 1
+    return n * row_bytes + 8 * (capacity + 1)
+
+
+def fill_keep_table(values, weights, capacity, packed=False, control=None, keep=None, flush_every=None):
+    """Fill the DP one item row at a time and return ``(last_row, keep)``.
+
+    Each row is a single ``np.maximum(prev, shifted_prev + v)`` over the
+    whole capacity axis, so only one value row is alive at a time.
+    ``keep[i, w]`` records whether item ``i`` was strictly better to take
+    at capacity ``w``, which is all the backtrack needs. With ``packed``
+    the rows are stored with :func:`numpy.packbits`, one bit per cell.
+    ``control`` (a :class:`SolveControl`) is advanced once per item row.
+
+    ``keep`` may be a zero-filled table supplied by the caller, such as a
+    :class:`numpy.memmap`; ``flush_every`` then writes it back to disk
+    every that many rows so its dirty pages can be dropped from RAM.
+    """
+    n = len(values)
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    if packed:
+        if keep is None:
+            keep = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+        take_row = np.zeros(capacity + 1, dtype=bool)
+    elif keep is None:
+        keep = np.zeros((n, capacity + 1), dtype=bool)
+
+    if control is not None:
+        control.start(n)
+    for i in range(n):
+        if control is not None:
+            control.advance()
+        if flush_every and i and i % flush_every == 0:
+            keep.flush()
+        wt, v = weights[i], values[i]
+        if wt > capacity:
+            continue
+        shifted = row[:capacity + 1 - wt] + v
+        take = shifted > row[wt:]
+        if packed:
+            take_row[:wt] = False
+            take_row[wt:] = take
+            keep[i] = np.packbits(take_row)
+        else:
+            keep[i, wt:] = take
+        np.maximum(row[wt:], shifted, out=row[wt:])
+
+    return row, keep
+
+
+def backtrack_keep(keep, weights, capacity, packed=False):
+    """Walk the keep table from the last item back to the first."""
+    w = capacity
+    chosen = []
+    for i in range(len(weights) - 1, -1, -1):
+        if packed:
+            taken = (keep[i, w >> 3] >> (7 - (w & 7))) & 1
+        else:
+            taken = keep[i, w]
+        if taken:
+            chosen.append(i)
+            w -= weights[i]
+    chosen.reverse()
+    return chosen
+
+
+def solve_numpy(values, weights, capacity, control=None, metrics=None):
+    """Row-vectorized 0/1 knapsack; picks the same items as :func:`solve_dp`."""
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+    with phase(metrics, "table fill", n * (capacity + 1), keep_table_bytes(n, capacity)):
+        _, keep = fill_keep_table(values, weights, capacity, control=control)
+    with phase(metrics, "backtrack", n):
+        chosen = backtrack_keep(keep, weights, capacity)
+    return build_result(chosen, values, weights, capacity, "numpy")
+
+
+def solve_bitset(values, weights, capacity, control=None, metrics=None):
+    """Like :func:`solve_numpy` but keeps a 1-bit-per-cell decision table.
+
+    Memory is about ``n * capacity / 8`` bytes, so n=2,000 and
+    capacity=200,000 fits in roughly 50 MB.
+    """
+    values, weights, capacity = validate_instance(values, weights, capacity)
+    n = len(values)
+    with phase(metrics, "table fill", n * (capacity + 1), keep_table_bytes(n, capacity, packed=True)):
+        _, keep = fill_keep_table(values, weights, capacity, packed=True, control=control)
+    with phase(metrics, "backtrack", n):
+        chosen = backtrack_keep(keep, weights, capacity, packed=True)
+    return build_result(chosen, values, weights, capacity, "bitset")
@@ -1,5 +1,9 @@
 import streamlit as st
 
+from knapsack_solver import SolveMetrics, cached_solve, solve_multidim, solve_prerequisites, solve_top_k
+from knapsack_solver.io import ItemNames, read_items
+from solver_ui import MAX_LISTED_ITEMS, describe_changes, show_metrics, solve_outcome, start_solve, time_limit_input
+
 # Page configuration
 st.set_page_config(page_title="Optimal Course Selection", page_icon="🎓", layout="centered")
 
@@ -33,55 +37,80 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def course_selection(course_names, values, credits, max_credits):
-    n = len(values)
-    
-    # DP table
-    dp = [[0] * (max_credits + 1) for _ in range(n + 1)]
+def _course_pairs(text, separator, index):
+    # "A: B; C: D" -> [(index of A, index of B), (index of C, index of D)]
+    pairs = []
+    for entry in text.split(";"):
+        if not entry.strip():
+            continue
+        names = [name.strip() for name in entry.split(separator)]
+        if len(names) != 2:
+            raise ValueError(f"expected 'course {separator} course', got '{entry.strip()}'")
+        for name in names:
+            if name not in index:
+                raise ValueError(f"unknown course '{name}'")
+        pairs.append((index[names[0]], index[names[1]]))
+    return pairs
 
-    # Fill DP table
-    for i in range(1, n + 1):
-        for c in range(1, max_credits + 1):
-            if credits[i - 1] <= c:
-                dp[i][c] = max(values[i - 1] + dp[i - 1][c - credits[i - 1]], 
-                               dp[i - 1][c])
-            else:
-                dp[i][c] = dp[i - 1][c]
 
-    # Backtrack to find selected courses
-    res = dp[n][max_credits]
-    c = max_credits
-    chosen = []
-    
-    for i in range(n, 0, -1):
-        if res <= 0:
-            break
-        if res == dp[i - 1][c]:
-            continue
-        else:
-            chosen.append(i - 1)
-            res -= values[i - 1]
-            c -= credits[i - 1]
+def course_selection(course_names, values, credits, max_credits, hours=None, max_hours=None, alternatives=0,
+                     prerequisites=None, clashes=None, control=None, cache=None, metrics=None):
+    constrained = prerequisites is not None or bool(clashes)
 
-    chosen.reverse()
+    # Next best plans, from one k-best DP pass whose first plan is the answer itself
+    ranked, alternative_plans = (), []
+    if alternatives and hours is None and not constrained:
+        try:
+            ranked = solve_top_k(values, credits, max_credits, k=alternatives + 1, control=control, metrics=metrics)
+        except ValueError as exc:
+            alternative_plans.append(f"Alternatives not listed: {exc}.")
+
+    if hours is not None:
+        result = solve_multidim(values, list(zip(credits, hours)), (max_credits, max_hours),
+                                control=control, metrics=metrics)
+    elif constrained:
+        result = solve_prerequisites(values, credits, max_credits, prerequisites or [None] * len(values),
+                                     clashes or (), control=control, metrics=metrics)
+    elif ranked:
+        result = ranked[0]
+    else:
+        result = cached_solve(values, credits, max_credits, cache=cache, control=control, metrics=metrics)
+    chosen = list(result.chosen)
+    for rank, plan in enumerate(ranked[1:], start=2):
+        alternative_plans.append(f"**Plan {rank}**: academic value {plan.total_value}, "
+                                 f"{describe_changes(course_names, chosen, plan.chosen)}")
 
     # Build descriptive advice
     if chosen:
         course_list = []
-        for i in chosen:
-            course_list.append(f"**{course_names[i]}** ({credits[i]} credits, academic value {values[i]})")
+        for i in chosen[:MAX_LISTED_ITEMS]:
+            hours_text = f", {hours[i]} weekly hours" if hours is not None else ""
+            course_list.append(f"**{course_names[i]}** ({credits[i]} credits{hours_text}, academic value {values[i]})")
+        if len(chosen) > MAX_LISTED_ITEMS:
+            course_list.append(f"{len(chosen) - MAX_LISTED_ITEMS} more courses")
         
         if len(course_list) == 1:
             courses_text = course_list[0]
         else:
             courses_text = ", ".join(course_list[:-1]) + f", and {course_list[-1]}"
 
-        return (f"🎓 To maximize your learning this semester within a limit of {max_credits} credits, "
+        limit_text = f"{max_credits} credits"
+        if hours is not None:
+            limit_text += f" and {max_hours} weekly contact hours"
+        if constrained:
+            limit_text += ", with every prerequisite met and no timetable clashes"
+        if result.optimal:
+            value_text = f"the **maximum achievable academic value of {result.total_value}**"
+        else:
+            value_text = (f"an **academic value of {result.total_value}**, the best found within the search limit "
+                          f"(no plan is worth more than {result.upper_bound})")
+        return (f"🎓 To maximize your learning this semester within a limit of {limit_text}, "
                 f"you should enroll in {courses_text}. "
-                f"This plan will give you the **maximum achievable academic value of {dp[n][max_credits]}**.")
+                f"This plan will give you {value_text}.",
+                alternative_plans)
     else:
         return (f"⚠️ Given your credit limit of {max_credits}, no combination of courses "
-                f"provides additional academic value.")
+                f"provides additional academic value.", alternative_plans)
 
 
 # ---- App Title ----
@@ -101,20 +130,91 @@ with col3:
     credits = st.text_input("Enter credit hours (space separated)", placeholder="e.g. 10 20 30")
 
 max_credits = st.text_input("Enter maximum credits allowed", placeholder="e.g. 50")
+alternatives = st.number_input("Next best plans to list (credit limit only)", min_value=0, max_value=10, value=0)
+
+col4, col5 = st.columns(2)
+with col4:
+    weekly_hours = st.text_input("Enter weekly contact hours (optional, space separated)", placeholder="e.g. 4 6 5")
+with col5:
+    max_hours = st.text_input("Enter maximum weekly hours (optional)", placeholder="e.g. 10")
+
+col6, col7 = st.columns(2)
+with col6:
+    prerequisite_text = st.text_input("Prerequisites (optional, course: required course; ...)",
+                                      placeholder="e.g. Machine Learning: Data Science")
+with col7:
+    clash_text = st.text_input("Timetable clashes (optional, course / course; ...)",
+                               placeholder="e.g. Algorithms / Machine Learning")
+
+upload = st.file_uploader("📂 Or upload the courses as a CSV, Parquet or NPY file "
+                          "(columns: name, value, credits, optional hours)", type=["csv", "parquet", "npy"])
+
+time_limit = time_limit_input("course")
 
 
 # ---- Button ----
 if st.button("📊 Get the Best Course Plan"):
-    course_list = [c.strip() for c in course_names.split(",") if c.strip()]
-    val = [int(i) for i in values.split()]
-    cr = [int(c) for c in credits.split()]
-    cap = int(max_credits.split()[0])
+    metrics = SolveMetrics()
+    with metrics.timer("parse"):
+        if upload is not None:
+            try:
+                courses = read_items(upload, ["value", "credits"], optional=["hours"], nonnegative=["credits", "hours"])
+            except ValueError as exc:
+                st.error(f"Could not read {upload.name}: {exc}")
+                st.stop()
+            val, cr, hrs = courses["value"], courses["credits"], courses.get("hours")
+            course_list = courses.get("name", ItemNames(len(val), "Course"))
+        else:
+            course_list = [c.strip() for c in course_names.split(",") if c.strip()]
+            val = [int(i) for i in values.split()]
+            cr = [int(c) for c in credits.split()]
+            hrs = [int(h) for h in weekly_hours.split()] or None
+        cap = int(max_credits.split()[0])
+        hrs_cap = int(max_hours.split()[0]) if max_hours.split() else None
+
+        if hrs is not None and hrs_cap is None:
+            st.error("Please enter the maximum weekly hours to use the contact hour limit.")
+            st.stop()
+
+        prereqs, clashes = None, []
+        if prerequisite_text.strip() or clash_text.strip():
+            if hrs is not None:
+                st.error("Prerequisites and timetable clashes cannot be combined with the weekly hour limit yet.")
+                st.stop()
+            index = {name: i for i, name in enumerate(course_list)}
+            try:
+                clashes = _course_pairs(clash_text, "/", index)
+                if prerequisite_text.strip():
+                    prereqs = [None] * len(val)
+                    for course, required in _course_pairs(prerequisite_text, ":", index):
+                        if prereqs[course] not in (None, required):
+                            raise ValueError(f"'{course_list[course]}' has more than one prerequisite")
+                        prereqs[course] = required
+            except ValueError as exc:
+                st.error(f"Could not read the prerequisites or clashes: {exc}")
+                st.stop()
+
+    def run(control, cache):
+        return course_selection(course_list, val, cr, cap, hrs, hrs_cap, alternatives, prereqs, clashes,
+                                control=control, cache=cache, metrics=metrics)
+
+    # Solve in the background so the page stays responsive and can be cancelled
+    start_solve("course", run, time_limit, course_list, val, cr, cap, hrs, hrs_cap, alternatives, prereqs, clashes,
+                metrics=metrics)
+
+
+# ---- Result ----
+outcome = solve_outcome("course")
+if outcome is not None:
+    result_text, alternative_plans = outcome
 
-    # Get result
-    result_text = course_selection(course_list, val, cr, cap)
+    with show_metrics("course"):
+        # Styled result box
+        st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
 
-    # Styled result box
-    st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
+        if alternative_plans:
+            st.subheader("🔁 Next Best Plans")
+            st.markdown("\n".join(f"- {plan}" for plan in alternative_plans))
 
     # Full Code Section
     st.subheader("📝 Full Code Implementation")
@@ -1,5 +1,12 @@
 import streamlit as st
 
+from knapsack_solver import SolveMetrics, cached_solve, profile_values, solve_multiple_choice, solve_top_k
+from knapsack_solver.io import ItemNames, read_items
+from solver_ui import MAX_LISTED_ITEMS, describe_changes, show_metrics, solve_outcome, start_solve, time_limit_input
+
+# Most points drawn on the budget sensitivity chart
+CHART_POINTS = 500
+
 # Page configuration
 st.set_page_config(page_title="Supply Chain Optimization", page_icon="🏭", layout="centered")
 
@@ -33,55 +40,53 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def supply_chain_optimization(materials, benefits, costs, budget):
-    n = len(benefits)
-    
-    # DP table
-    dp = [[0] * (budget + 1) for _ in range(n + 1)]
-
-    # Fill DP table
-    for i in range(1, n + 1):
-        for b in range(1, budget + 1):
-            if costs[i - 1] <= b:
-                dp[i][b] = max(benefits[i - 1] + dp[i - 1][b - costs[i - 1]], 
-                               dp[i - 1][b])
-            else:
-                dp[i][b] = dp[i - 1][b]
-
-    # Backtrack to find selected suppliers/materials
-    res = dp[n][budget]
-    b = budget
-    chosen = []
-    
-    for i in range(n, 0, -1):
-        if res <= 0:
-            break
-        if res == dp[i - 1][b]:
-            continue
-        else:
-            chosen.append(i - 1)
-            res -= benefits[i - 1]
-            b -= costs[i - 1]
-
-    chosen.reverse()
+def supply_chain_optimization(materials, benefits, costs, budget, alternatives=0, groups=None, control=None,
+                              cache=None, metrics=None):
+    # Next best selections, from one k-best DP pass whose first selection is the answer itself
+    ranked, alternative_picks = (), []
+    if alternatives and groups is None:
+        try:
+            ranked = solve_top_k(benefits, costs, budget, k=alternatives + 1, control=control, metrics=metrics)
+        except ValueError as exc:
+            alternative_picks.append(f"Alternatives not listed: {exc}.")
+
+    if groups is not None:
+        # One supplier per material group
+        result = solve_multiple_choice(groups, benefits, costs, budget, control=control, metrics=metrics)
+    elif ranked:
+        result = ranked[0]
+    else:
+        result = cached_solve(benefits, costs, budget, cache=cache, control=control, metrics=metrics)
+    chosen = list(result.chosen)
+    for rank, pick in enumerate(ranked[1:], start=2):
+        alternative_picks.append(f"**Option {rank}**: output {pick.total_value}, "
+                                 f"{describe_changes(materials, chosen, pick.chosen)}")
 
     # Build descriptive advice
     if chosen:
         selection_list = []
-        for i in chosen:
-            selection_list.append(f"**{materials[i]}** (cost {costs[i]}, benefit {benefits[i]})")
+        for i in chosen[:MAX_LISTED_ITEMS]:
+            group_text = f"for {groups[i]}, " if groups is not None else ""
+            selection_list.append(f"**{materials[i]}** ({group_text}cost {costs[i]}, benefit {benefits[i]})")
+        if len(chosen) > MAX_LISTED_ITEMS:
+            selection_list.append(f"{len(chosen) - MAX_LISTED_ITEMS} more suppliers/materials")
         
         if len(selection_list) == 1:
             materials_text = selection_list[0]
         else:
             materials_text = ", ".join(selection_list[:-1]) + f", and {selection_list[-1]}"
 
+        if groups is not None:
+            materials_text += (f", contracting at most one supplier per material "
+                               f"({result.preprocess['items_after']} of {result.preprocess['items_before']} "
+                               f"offers were worth comparing)")
         return (f"🏭 To optimize your supply chain within a budget of {budget}, "
                 f"you should source {materials_text}. "
-                f"This selection will yield the **maximum achievable production output/profit of {dp[n][budget]}**.")
+                f"This selection will yield the **maximum achievable production output/profit of {result.total_value}**.",
+                alternative_picks)
     else:
         return (f"⚠️ Given the budget of {budget}, no combination of suppliers or raw materials "
-                f"can improve production output.")
+                f"can improve production output.", alternative_picks)
 
 
 # ---- App Title ----
@@ -101,20 +106,73 @@ with col3:
     costs = st.text_input("Enter costs (space separated)", placeholder="e.g. 10 20 30")
 
 budget = st.text_input("Enter budget available", placeholder="e.g. 50")
+supplier_groups = st.text_input("Material each supplier offers (optional, comma separated; "
+                                "only one supplier is contracted per material)", placeholder="e.g. Steel, Steel, Copper")
+alternatives = st.number_input("Next best selections to list (without material groups)",
+                               min_value=0, max_value=10, value=0)
+show_sensitivity = st.checkbox("Show budget sensitivity chart")
+upload = st.file_uploader("📂 Or upload the suppliers/materials as a CSV, Parquet or NPY file "
+                          "(columns: name, benefit, cost, optional group)", type=["csv", "parquet", "npy"])
+time_limit = time_limit_input("supply")
 
 
 # ---- Button ----
 if st.button("🚀 Optimize Supply Chain"):
-    material_list = [m.strip() for m in materials.split(",") if m.strip()]
-    ben = [int(i) for i in benefits.split()]
-    cost = [int(c) for c in costs.split()]
-    bud = int(budget.split()[0])
-
-    # Get result
-    result_text = supply_chain_optimization(material_list, ben, cost, bud)
-
-    # Styled result box
-    st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
+    metrics = SolveMetrics()
+    with metrics.timer("parse"):
+        if upload is not None:
+            try:
+                supplies = read_items(upload, ["benefit", "cost"], nonnegative=["cost"], labels=["group"])
+            except ValueError as exc:
+                st.error(f"Could not read {upload.name}: {exc}")
+                st.stop()
+            ben, cost = supplies["benefit"], supplies["cost"]
+            material_list = supplies.get("name", ItemNames(len(ben), "Supplier"))
+            groups = supplies.get("group")
+        else:
+            material_list = [m.strip() for m in materials.split(",") if m.strip()]
+            ben = [int(i) for i in benefits.split()]
+            cost = [int(c) for c in costs.split()]
+            groups = [g.strip() for g in supplier_groups.split(",") if g.strip()] or None
+        bud = int(budget.split()[0])
+
+        if groups is not None and len(groups) != len(ben):
+            st.error(f"Please give a material for each of the {len(ben)} suppliers (got {len(groups)}).")
+            st.stop()
+
+    def run(control, cache):
+        result_text, alternative_picks = supply_chain_optimization(material_list, ben, cost, bud, alternatives, groups,
+                                                                   control=control, cache=cache, metrics=metrics)
+        if not show_sensitivity or groups is not None:
+            return result_text, alternative_picks, None
+        # Budget sensitivity: one value-only DP pass gives the best output for every charted budget
+        step = max(1, bud // CHART_POINTS)
+        budgets = list(range(0, bud + 1, step))
+        best_output = profile_values(ben, cost, budgets, control=control, metrics=metrics)
+        chart = {"Budget": budgets, "Best output": best_output.tolist()}
+        return result_text, alternative_picks, chart
+
+    # Solve in the background so the page stays responsive and can be cancelled
+    start_solve("supply", run, time_limit, material_list, ben, cost, bud, show_sensitivity, alternatives, groups,
+                metrics=metrics)
+
+
+# ---- Result ----
+outcome = solve_outcome("supply")
+if outcome is not None:
+    result_text, alternative_picks, chart = outcome
+
+    with show_metrics("supply"):
+        # Styled result box
+        st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
+
+        if alternative_picks:
+            st.subheader("🔁 Next Best Selections")
+            st.markdown("\n".join(f"- {pick}" for pick in alternative_picks))
+
+        if chart:
+            st.subheader("📈 Budget Sensitivity")
+            st.line_chart(chart, x="Budget", y="Best output")
 
     # Full Code Section
     st.subheader("📝 Full Code Implementation")
@@ -1,5 +1,11 @@
+import time
+
 import streamlit as st
 
+from knapsack_solver import UNLIMITED, SolveMetrics, cached_solve, solve, solve_bounded
+from knapsack_solver.io import ItemNames, read_items
+from solver_ui import MAX_LISTED_ITEMS, show_metrics, solve_outcome, start_solve, time_limit_input
+
 # Page configuration
 st.set_page_config(page_title="Shopping Cart Optimization", page_icon="🛒", layout="centered")
 
@@ -33,55 +39,60 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def shopping_cart_optimization(items, values, prices, budget):
-    n = len(values)
-    
-    # DP table
-    dp = [[0] * (budget + 1) for _ in range(n + 1)]
+SOLVE_MODES = {
+    "Exact": "auto",
+    "Approximate (FPTAS)": "fptas",
+    "Greedy": "greedy",
+}
 
-    # Fill DP table
-    for i in range(1, n + 1):
-        for b in range(1, budget + 1):
-            if prices[i - 1] <= b:
-                dp[i][b] = max(values[i - 1] + dp[i - 1][b - prices[i - 1]], 
-                               dp[i - 1][b])
-            else:
-                dp[i][b] = dp[i - 1][b]
-
-    # Backtrack to find selected items
-    res = dp[n][budget]
-    b = budget
-    chosen = []
-    
-    for i in range(n, 0, -1):
-        if res <= 0:
-            break
-        if res == dp[i - 1][b]:
-            continue
-        else:
-            chosen.append(i - 1)
-            res -= values[i - 1]
-            b -= prices[i - 1]
 
-    chosen.reverse()
+def parse_quantities(text):
+    """Space separated purchase limits; ``*`` or ``inf`` means unlimited. Blank means one of each."""
+    if not text.strip():
+        return None
+    return [UNLIMITED if q.lower() in ("*", "inf", "unlimited") else int(q) for q in text.split()]
+
+
+def shopping_cart_optimization(items, values, prices, budget, quantities=None, method="auto", cache=None,
+                               **options):
+    if quantities is None:
+        result = cached_solve(values, prices, budget, method=method, cache=cache, **options)
+    else:
+        result = solve_bounded(values, prices, budget, quantities, method=method, **options)
+    chosen = list(result.chosen)
+    counts = result.counts or (1,) * len(chosen)
 
     # Build descriptive advice
     if chosen:
         selection_list = []
         total_spent = 0
-        for i in chosen:
-            selection_list.append(f"**{items[i]}** (price {prices[i]}, value {values[i]})")
-            total_spent += prices[i]
+        for k, (i, count) in enumerate(zip(chosen, counts)):
+            if k < MAX_LISTED_ITEMS:
+                quantity_text = f"{count} × " if count > 1 else ""
+                selection_list.append(f"{quantity_text}**{items[i]}** (price {prices[i]}, value {values[i]})")
+            total_spent += prices[i] * count
+        if len(chosen) > MAX_LISTED_ITEMS:
+            selection_list.append(f"{len(chosen) - MAX_LISTED_ITEMS} more items")
         
         if len(selection_list) == 1:
             items_text = selection_list[0]
         else:
             items_text = ", ".join(selection_list[:-1]) + f", and {selection_list[-1]}"
 
+        if result.optimal:
+            value_text = f"the **maximum achievable value/utility of {result.total_value}**"
+        else:
+            value_text = (f"a **value/utility of {result.total_value}**, guaranteed to be within "
+                          f"{result.gap:.1%} of the best possible (at most {result.upper_bound})")
+
+        fallback_text = ""
+        if method == "fptas" and result.method == "greedy":
+            fallback_text = " The FPTAS would not fit in the latency budget, so the greedy heuristic answered."
+
         return (f"🛒 To optimize your shopping within a budget of {budget}, "
                 f"you should buy {items_text}. "
-                f"This selection will give you the **maximum achievable value/utility of {dp[n][budget]}** "
-                f"while spending a total of {total_spent}.")
+                f"This selection will give you {value_text} "
+                f"while spending a total of {total_spent}.{fallback_text}")
     else:
         return (f"⚠️ Given the budget of {budget}, no combination of items "
                 f"can provide positive value.")
@@ -104,20 +115,87 @@ with col3:
     prices = st.text_input("Enter prices (space separated)", placeholder="e.g. 10 20 30")
 
 budget = st.text_input("Enter budget", placeholder="e.g. 50")
+quantities = st.text_input("Enter maximum quantity of each item (optional, space separated, * for unlimited)",
+                           placeholder="e.g. 1 3 *")
+
+mode = st.radio("Solve mode", list(SOLVE_MODES), horizontal=True)
+epsilon = 0.1
+latency_budget = None
+if mode == "Approximate (FPTAS)":
+    epsilon = st.slider("Allowed loss of value (ε)", min_value=0.01, max_value=0.5, value=0.1, step=0.01)
+    latency_budget = st.number_input("Latency budget in seconds (0 for none; the greedy heuristic answers "
+                                     "when the FPTAS would take longer)", min_value=0.0, value=0.0, step=0.1) or None
+compare_exact = mode != "Exact" and st.checkbox("Compare runtime with the exact DP", value=False)
+upload = st.file_uploader("📂 Or upload the items as a CSV, Parquet or NPY file "
+                          "(columns: name, value, price, optional quantity)", type=["csv", "parquet", "npy"])
+time_limit = time_limit_input("shopping")
 
 
 # ---- Button ----
 if st.button("🚀 Optimize Shopping Cart"):
-    item_list = [m.strip() for m in items.split(",") if m.strip()]
-    val = [int(i) for i in values.split()]
-    price = [int(c) for c in prices.split()]
-    bud = int(budget.split()[0])
+    metrics = SolveMetrics()
+    with metrics.timer("parse"):
+        if upload is not None:
+            try:
+                products = read_items(upload, ["value", "price"], optional=["quantity"],
+                                      nonnegative=["price", "quantity"])
+            except ValueError as exc:
+                st.error(f"Could not read {upload.name}: {exc}")
+                st.stop()
+            val, price, limits = products["value"], products["price"], products.get("quantity")
+            item_list = products.get("name", ItemNames(len(val)))
+        else:
+            item_list = [m.strip() for m in items.split(",") if m.strip()]
+            val = [int(i) for i in values.split()]
+            price = [int(c) for c in prices.split()]
+            limits = parse_quantities(quantities)
+        bud = int(budget.split()[0])
+
+        method = SOLVE_MODES[mode]
+        options = {"epsilon": epsilon, "latency_budget": latency_budget} if method == "fptas" else {}
+
+    def run(control, cache):
+        start = time.perf_counter()
+        result_text = shopping_cart_optimization(item_list, val, price, bud, limits, method=method,
+                                                 control=control, cache=cache, metrics=metrics, **options)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return result_text, mode, elapsed_ms
+
+    def run_exact(control, cache):
+        start = time.perf_counter()
+        if limits is None:
+            optimum = solve(val, price, bud, control=control)
+        else:
+            optimum = solve_bounded(val, price, bud, limits, control=control)
+        return (time.perf_counter() - start) * 1000, optimum.total_value
+
+    # Solve in the background so the page stays responsive and can be cancelled
+    start_solve("shopping", run, time_limit, item_list, val, price, bud, limits, mode, options, metrics=metrics)
+    # The exact DP is a job of its own, so the approximate result shows first and survives its timeout
+    if compare_exact:
+        start_solve("shopping_exact", run_exact, time_limit, val, price, bud, limits)
+    else:
+        st.session_state.pop("shopping_exact_job", None)
+
+
+# ---- Result ----
+outcome = solve_outcome("shopping")
+if outcome is not None:
+    result_text, solved_mode, elapsed_ms = outcome
+
+    with show_metrics("shopping"):
+        # Styled result box
+        st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
 
-    # Get result
-    result_text = shopping_cart_optimization(item_list, val, price, bud)
+        # Measured runtime
+        timing_cols = st.columns(2)
+        timing_cols[0].metric(f"⏱ {solved_mode} runtime", f"{elapsed_ms:.2f} ms")
 
-    # Styled result box
-    st.markdown(f"<div class='result-box'>{result_text}</div>", unsafe_allow_html=True)
+    with timing_cols[1]:
+        exact = solve_outcome("shopping_exact")
+        if exact is not None:
+            exact_ms, exact_value = exact
+            st.metric("⏱ Exact DP runtime", f"{exact_ms:.2f} ms", help=f"Exact optimum: {exact_value}")
 
     # Full Code Section
     st.subheader("📝 Full Code Implementation")
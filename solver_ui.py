@@ -0,0 +1,146 @@
+"""Background solving for the Streamlit pages: progress bar, cancel button and time limit."""
+
+import hashlib
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import streamlit as st
+
+from knapsack_solver import SolveCancelled, SolveTimeout, default_cache
+from knapsack_solver.jobs import JobRunner
+
+# Default seconds a solve may run before it is stopped
+DEFAULT_TIME_LIMIT = 30.0
+
+# Seconds between progress bar refreshes while a solve runs
+POLL_INTERVAL = 0.1
+
+# Longest item list spelled out in a page's result text; the rest are counted
+MAX_LISTED_ITEMS = 25
+
+
+@st.cache_resource
+def get_job_runner():
+    """One worker pool for every session, so a rerun re-attaches to its running solve."""
+    return JobRunner()
+
+
+@st.cache_resource
+def get_solve_cache():
+    return default_cache
+
+
+def time_limit_input(page):
+    with st.expander("⚙️ Solver settings"):
+        limit = st.number_input("Time limit in seconds (0 for none)", min_value=0.0,
+                                value=DEFAULT_TIME_LIMIT, step=5.0, key=f"{page}_time_limit")
+    return limit or None
+
+
+def start_solve(page, fn, time_limit, *inputs, metrics=None):
+    """Run ``fn(control, cache)`` on a worker thread for this page.
+
+    The job is keyed by ``inputs``, so pressing the button again with the
+    same inputs re-attaches to the running or finished job instead of
+    solving again. ``metrics`` is kept with the job for :func:`show_metrics`.
+    """
+    digest = hashlib.blake2b(repr((page, time_limit)).encode(), digest_size=16)
+    for value in inputs:
+        # repr() elides the middle of large arrays, so hash their bytes instead
+        if isinstance(value, np.ndarray):
+            digest.update(f"|{value.dtype}{value.shape}|".encode())
+            if value.dtype == object:
+                digest.update("\0".join(map(str, value)).encode())
+            else:
+                digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(f"|{value!r}".encode())
+    key = digest.hexdigest()
+    cache = get_solve_cache()
+    get_job_runner().submit(key, lambda control: fn(control, cache), time_limit, metrics)
+    st.session_state[f"{page}_job"] = key
+
+
+def solve_outcome(page):
+    """Wait for the page's current solve behind a progress bar and a cancel button.
+
+    Returns what the job returned, or ``None`` if there is no job or it was
+    cancelled, timed out or rejected its input (a message is shown).
+    """
+    key = st.session_state.get(f"{page}_job")
+    job = get_job_runner().get(key) if key else None
+    if job is None:
+        return None
+
+    if not job.done():
+        if st.button("✖ Cancel", key=f"{page}_cancel"):
+            job.cancel()
+        bar = st.progress(0.0, text="Solving…")
+        while not job.done():
+            bar.progress(job.progress, text=f"Solving… {job.progress:.0%}")
+            time.sleep(POLL_INTERVAL)
+        bar.empty()
+
+    try:
+        return job.result()
+    except SolveTimeout as exc:
+        st.warning(f"⏱ The {exc}. Raise the time limit under Solver settings and try again.")
+    except SolveCancelled:
+        st.info("✖ Solve cancelled.")
+    except ValueError as exc:
+        st.error(f"⚠️ {exc}")
+    return None
+
+
+def describe_changes(names, best, other):
+    """Spell out how the item set ``other`` differs from ``best``, e.g. for a next-best alternative."""
+    dropped = [f"**{names[i]}**" for i in sorted(set(best) - set(other))][:MAX_LISTED_ITEMS]
+    added = [f"**{names[i]}**" for i in sorted(set(other) - set(best))][:MAX_LISTED_ITEMS]
+    changes = []
+    if dropped:
+        changes.append("without " + ", ".join(dropped))
+    if added:
+        changes.append("adding " + ", ".join(added))
+    return "; ".join(changes)
+
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+
+
+def metrics_panel(metrics, key):
+    """Collapsible table of what each phase of the solve cost, with a JSON download."""
+    with st.expander("📊 Solve metrics"):
+        st.table([
+            {
+                "Phase": row["phase"],
+                "Wall time (ms)": f"{row['wall_ms']:.2f}",
+                "Cells evaluated": f"{row['cells']:,}",
+                "Peak table memory": _format_bytes(row["peak_bytes"]),
+            }
+            for row in metrics.rows()
+        ])
+        st.caption(f"Total {metrics.total_ms:.2f} ms · cache hits {metrics.cache_hits}, "
+                   f"misses {metrics.cache_misses}")
+        st.download_button("⬇️ Download metrics as JSON", metrics.to_json(indent=2),
+                           file_name="solve_metrics.json", mime="application/json", key=f"{key}_metrics_json")
+
+
+@contextmanager
+def show_metrics(page):
+    """Time the ``with`` block as the render phase, then show the metrics panel below it."""
+    key = st.session_state.get(f"{page}_job")
+    job = get_job_runner().get(key) if key else None
+    metrics = job.metrics if job is not None else None
+    if metrics is None:
+        yield
+        return
+    # Every rerun renders again, so only the latest render counts
+    metrics.phases.pop("render", None)
+    with metrics.timer("render"):
+        yield
+    metrics_panel(metrics, page)
@@ -0,0 +1,42 @@
+import random
+
+import pandas as pd
+import pytest
+
+from knapsack_solver.batch import read_manifest, read_table_instances
+
+
+def write_manifest(path, sizes):
+    rng = random.Random(0)
+    rows = []
+    for k, size in enumerate(sizes):
+        for _ in range(size):
+            rows.append({"id": f"case-{k}", "value": rng.randint(0, 50), "weight": rng.randint(1, 30),
+                         "capacity": 40 + k})
+    frame = pd.DataFrame(rows, columns=["id", "value", "weight", "capacity"])
+    if path.suffix == ".csv":
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_parquet(path, index=False)
+    return frame
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+@pytest.mark.parametrize("batch_rows", [1, 3, 7, 1000])
+def test_instances_span_batches(tmp_path, suffix, batch_rows):
+    path = tmp_path / f"manifest{suffix}"
+    frame = write_manifest(path, [5, 1, 9, 2, 4])
+    instances = list(read_table_instances(path, batch_rows=batch_rows))
+
+    assert [instance["id"] for instance in instances] == [f"case-{k}" for k in range(5)]
+    for k, instance in enumerate(instances):
+        rows = frame[frame["id"] == f"case-{k}"]
+        assert instance["values"].tolist() == rows["value"].tolist()
+        assert instance["weights"].tolist() == rows["weight"].tolist()
+        assert instance["capacity"] == 40 + k
+
+
+def test_empty_table_has_no_instances(tmp_path):
+    path = tmp_path / "manifest.csv"
+    path.write_text("id,value,weight,capacity\n")
+    assert list(read_manifest(path)) == []
@@ -0,0 +1,36 @@
+from knapsack_solver import SolveCache, SolveControl, cached_solve
+
+VALUES = [60, 100, 120, 30, 75, 45, 90]
+WEIGHTS = [10, 20, 30, 5, 25, 15, 35]
+CAPACITY = 60
+
+
+def test_approximate_results_are_cached_under_a_control():
+    cache = SolveCache()
+    for _ in range(3):
+        cached_solve(VALUES, WEIGHTS, CAPACITY, method="fptas", epsilon=0.5, cache=cache, control=SolveControl(30))
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 2
+    assert len(cache) == 1
+
+
+def test_search_stopped_by_its_control_is_not_cached():
+    cache = SolveCache()
+    stopped = SolveControl()
+    stopped.cancel()
+    result = cached_solve(VALUES, WEIGHTS, CAPACITY, method="branch_and_bound", node_limit=1, cache=cache,
+                          control=stopped)
+    assert not result.optimal
+    assert len(cache) == 0
+
+    result = cached_solve(VALUES, WEIGHTS, CAPACITY, method="branch_and_bound", node_limit=1, cache=cache,
+                          control=SolveControl(30))
+    assert not result.optimal
+    assert len(cache) == 1
+
+
+def test_time_limit_is_not_part_of_the_key():
+    cache = SolveCache()
+    first = cached_solve(VALUES, WEIGHTS, CAPACITY, method="branch_and_bound", cache=cache, time_limit=30)
+    second = cached_solve(VALUES, WEIGHTS, CAPACITY, method="branch_and_bound", cache=cache)
+    assert first.optimal and second is first
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from knapsack_solver import IncrementalKnapsack, solve_dp
+
+
+def check(knapsack, values, weights):
+    assert knapsack.values == values
+    assert knapsack.weights == weights
+    for capacity in range(knapsack.max_capacity + 1):
+        expected = solve_dp(values, weights, capacity)
+        assert knapsack.best_value(capacity) == expected.total_value
+        assert knapsack.profile()[capacity] == expected.total_value
+        assert knapsack.solve(capacity).chosen == expected.chosen
+
+
+def test_edits_match_solve_dp():
+    rng = random.Random(0)
+    for _ in range(40):
+        values = [rng.randint(-2, 20) for _ in range(rng.randint(0, 6))]
+        weights = [rng.randint(0, 12) for _ in values]
+        knapsack = IncrementalKnapsack(rng.randint(0, 20), values, weights)
+        check(knapsack, values, weights)
+        for _ in range(12):
+            edit = rng.choice(["append", "update", "remove", "extend"])
+            if edit == "append" or not values:
+                values.append(rng.randint(-2, 20))
+                weights.append(rng.randint(0, 12))
+                knapsack.append(values[-1], weights[-1])
+            elif edit == "update":
+                # Negative indices count from the end, as for lists
+                index = rng.randrange(-len(values), len(values))
+                value = rng.choice([None, rng.randint(-2, 20)])
+                weight = rng.choice([None, rng.randint(0, 30)])
+                if value is not None:
+                    values[index] = value
+                if weight is not None:
+                    weights[index] = weight
+                knapsack.update(index, value=value, weight=weight)
+            elif edit == "remove":
+                index = rng.randrange(-len(values), len(values))
+                del values[index], weights[index]
+                knapsack.remove(index)
+            else:
+                knapsack.extend_capacity(knapsack.max_capacity + rng.randint(-3, 15))
+            check(knapsack, values, weights)
+
+
+def test_rejects_bad_edits():
+    knapsack = IncrementalKnapsack(10, [5], [3])
+    with pytest.raises(ValueError):
+        knapsack.update(0, weight=-1)
+    with pytest.raises(IndexError):
+        knapsack.remove(1)
+    with pytest.raises(ValueError):
+        knapsack.best_value(11)
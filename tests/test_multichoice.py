@@ -0,0 +1,52 @@
+import itertools
+import random
+
+import pytest
+
+from knapsack_solver import solve_multiple_choice
+
+
+def brute_force_multiple_choice(groups, values, weights, capacity):
+    # Each group contributes one of its items or none (None)
+    members = {}
+    for i, group in enumerate(groups):
+        members.setdefault(group, []).append(i)
+    best = 0
+    for picks in itertools.product(*([None] + items for items in members.values())):
+        chosen = [i for i in picks if i is not None]
+        if sum(weights[i] for i in chosen) <= capacity:
+            best = max(best, sum(values[i] for i in chosen))
+    return best
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(400):
+        n = rng.randint(0, 10)
+        groups = [rng.choice("abcd") for _ in range(n)]
+        values = [rng.randint(-2, 30) for _ in range(n)]
+        weights = [rng.randint(0, 15) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        result = solve_multiple_choice(groups, values, weights, capacity)
+
+        assert result.total_value == brute_force_multiple_choice(groups, values, weights, capacity)
+        assert result.total_weight == sum(weights[i] for i in result.chosen) <= capacity
+        used = [groups[i] for i in result.chosen]
+        assert len(used) == len(set(used))
+
+
+def test_preprocess_counts_undominated_options():
+    groups = ["steel", "steel", "steel", "steel", "copper", "copper", "wood"]
+    values = [50, 40, 70, 0, 30, 30, 10]
+    weights = [10, 12, 20, 1, 5, 5, 99]
+    # Steel keeps 10/50 and 20/70: 12/40 is dominated and 1/0 is worthless.
+    # Copper keeps one of its equal offers and the wood does not fit.
+    result = solve_multiple_choice(groups, values, weights, 30)
+    assert result.preprocess == {"items_before": 7, "items_after": 3}
+    assert result.total_value == 100
+    assert result.chosen == (2, 4)
+
+
+def test_group_labels_must_match_items():
+    with pytest.raises(ValueError):
+        solve_multiple_choice(["a"], [1, 2], [1, 2], 5)
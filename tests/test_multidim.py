@@ -0,0 +1,64 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from knapsack_solver import multidim, solve_multidim
+
+
+def brute_force_multidim(values, weights, capacities):
+    best = 0
+    for r in range(len(values) + 1):
+        for subset in itertools.combinations(range(len(values)), r):
+            if all(sum(weights[i][d] for i in subset) <= c for d, c in enumerate(capacities)):
+                best = max(best, sum(values[i] for i in subset))
+    return best
+
+
+@pytest.mark.parametrize("grid_cells", [multidim._DOMINANCE_GRID_CELLS, 0])
+def test_matches_brute_force(monkeypatch, grid_cells):
+    # Zero grid cells forces the Fenwick sweep for two resources
+    monkeypatch.setattr(multidim, "_DOMINANCE_GRID_CELLS", grid_cells)
+    rng = random.Random(0)
+    for _ in range(300):
+        dims = rng.randint(1, 3)
+        n = rng.randint(0, 9)
+        values = [rng.randint(-2, 20) for _ in range(n)]
+        weights = [tuple(rng.randint(0, 12) for _ in range(dims)) for _ in range(n)]
+        capacities = tuple(rng.randint(0, 40) for _ in range(dims))
+        result = solve_multidim(values, weights, capacities)
+        assert result.total_value == brute_force_multidim(values, weights, capacities)
+        assert result.total_value == sum(values[i] for i in result.chosen)
+        for d, capacity in enumerate(capacities):
+            assert result.usage[d] == sum(weights[i][d] for i in result.chosen) <= capacity
+
+
+@pytest.mark.parametrize("grid_cells", [multidim._DOMINANCE_GRID_CELLS, 16])
+def test_three_resources_at_realistic_size(monkeypatch, grid_cells):
+    # A tiny grid coarsens the two-resource lookups, which may only keep extra states
+    monkeypatch.setattr(multidim, "_DOMINANCE_GRID_CELLS", grid_cells)
+    rng = random.Random(0)
+    values = [rng.randint(1, 100) for _ in range(100)]
+    weights = [tuple(rng.randint(1, 100) for _ in range(3)) for _ in range(100)]
+    result = solve_multidim(values, weights, (1000, 1000, 1000))
+
+    # The same instance with a fourth, unused resource goes through the blockwise check instead
+    padded = solve_multidim(values, [w + (0,) for w in weights], (1000, 1000, 1000, 0))
+    assert result.total_value == padded.total_value
+    assert result.total_value == sum(values[i] for i in result.chosen)
+    assert all(u <= 1000 for u in result.usage)
+
+
+def test_undominated_matches_pairwise_check():
+    rng = np.random.default_rng(0)
+    for dims in (3, 4):
+        usage = rng.integers(0, 30, size=(600, dims))
+        value = rng.integers(0, 50, size=600)
+        expected = [
+            s for s in range(len(value))
+            if not any((usage[t] <= usage[s]).all() and value[t] >= value[s]
+                       and ((usage[t] != usage[s]).any() or value[t] > value[s] or t < s)
+                       for t in range(len(value)) if t != s)
+        ]
+        assert np.flatnonzero(multidim._undominated(usage, value)).tolist() == expected
@@ -0,0 +1,42 @@
+import itertools
+import random
+
+from knapsack_solver import solve_fleet
+
+
+def brute_force_fleet(values, weights, capacities):
+    # Every item goes to one vehicle or to none (-1)
+    best = 0
+    for placement in itertools.product(range(-1, len(capacities)), repeat=len(values)):
+        loads = [0] * len(capacities)
+        for i, vehicle in enumerate(placement):
+            if vehicle >= 0:
+                loads[vehicle] += weights[i]
+        if all(load <= capacity for load, capacity in zip(loads, capacities)):
+            best = max(best, sum(v for v, vehicle in zip(values, placement) if vehicle >= 0))
+    return best
+
+
+def check_fleet(values, weights, capacities):
+    result = solve_fleet(values, weights, capacities)
+    loaded = [i for items in result.assignments for i in items]
+    assert len(loaded) == len(set(loaded)), result
+    for items, capacity, load in zip(result.assignments, capacities, result.loads):
+        assert load == sum(weights[i] for i in items) <= capacity
+    assert result.total_value == sum(values[i] for i in loaded)
+    assert result.optimal
+    assert result.total_value == brute_force_fleet(values, weights, capacities)
+
+
+def test_zero_weight_items_are_loaded_once():
+    check_fleet([13, 19, 5, 15, 3, 20], [9, 9, 11, 12, 0, 3], [13, 8])
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(0, 6)
+        values = [rng.randint(0, 20) for _ in range(n)]
+        weights = [rng.randint(0, 12) for _ in range(n)]
+        capacities = [rng.randint(0, 15) for _ in range(rng.randint(1, 3))]
+        check_fleet(values, weights, capacities)
@@ -0,0 +1,84 @@
+import itertools
+import random
+
+import pytest
+
+from knapsack_solver import solve_prerequisites
+from knapsack_solver.precedence import preorder
+
+
+def feasible(subset, weights, capacity, prerequisites, conflicts):
+    taken = set(subset)
+    return (sum(weights[i] for i in subset) <= capacity
+            and all(prerequisites[i] is None or prerequisites[i] in taken for i in subset)
+            and not any(a in taken and b in taken for a, b in conflicts))
+
+
+def brute_force_prerequisites(values, weights, capacity, prerequisites, conflicts):
+    best = 0
+    for r in range(len(values) + 1):
+        for subset in itertools.combinations(range(len(values)), r):
+            if feasible(subset, weights, capacity, prerequisites, conflicts):
+                best = max(best, sum(values[i] for i in subset))
+    return best
+
+
+def random_instance(rng):
+    n = rng.randint(0, 10)
+    values = [rng.randint(-3, 30) for _ in range(n)]
+    weights = [rng.randint(0, 15) for _ in range(n)]
+    capacity = rng.randint(0, 50)
+    # A random forest: each item's prerequisite comes earlier in a shuffled
+    # order, so parents often have higher indices than their children
+    order = list(range(n))
+    rng.shuffle(order)
+    prerequisites = [None] * n
+    for k, item in enumerate(order[1:], start=1):
+        if rng.random() < 0.6:
+            prerequisites[item] = order[rng.randrange(k)]
+    pairs = list(itertools.combinations(range(n), 2))
+    conflicts = rng.sample(pairs, min(len(pairs), rng.randint(0, 6)))
+    return values, weights, capacity, prerequisites, conflicts
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(400):
+        values, weights, capacity, prerequisites, conflicts = random_instance(rng)
+        result = solve_prerequisites(values, weights, capacity, prerequisites, conflicts)
+        assert result.optimal
+        assert feasible(result.chosen, weights, capacity, prerequisites, conflicts)
+        assert result.total_value == brute_force_prerequisites(values, weights, capacity, prerequisites, conflicts)
+
+
+def test_node_limit_returns_a_feasible_plan_and_a_valid_bound():
+    rng = random.Random(1)
+    for _ in range(400):
+        values, weights, capacity, prerequisites, conflicts = random_instance(rng)
+        optimum = brute_force_prerequisites(values, weights, capacity, prerequisites, conflicts)
+        result = solve_prerequisites(values, weights, capacity, prerequisites, conflicts, node_limit=0)
+        assert feasible(result.chosen, weights, capacity, prerequisites, conflicts)
+        if result.optimal:
+            assert result.total_value == optimum
+        else:
+            assert result.total_value <= optimum <= result.upper_bound
+
+
+def test_preorder_spans_subtrees():
+    prerequisites = [3, None, 3, None, 2, 1]
+    order, end = preorder(prerequisites)
+    assert sorted(order) == list(range(6))
+    for p, item in enumerate(order):
+        subtree = set(order[p:end[p]])
+        for other in range(6):
+            ancestor, node = False, other
+            while node is not None:
+                ancestor = ancestor or node == item
+                node = prerequisites[node]
+            assert ancestor == (other in subtree)
+
+
+@pytest.mark.parametrize("prerequisites", [[1, 0], [0], [5, None]])
+def test_invalid_forests_are_rejected(prerequisites):
+    with pytest.raises(ValueError):
+        preorder(prerequisites)
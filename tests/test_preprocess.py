@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from knapsack_solver import reduce_instance, solve
+
+
+def random_instance(rng):
+    n = rng.randint(0, 12)
+    scale = rng.choice([1, 2, 3, 6])
+    values = [rng.randint(-3, 30) for _ in range(n)]
+    weights = [scale * rng.randint(0, 10) for _ in range(n)]
+    # Some items are too heavy, and sometimes everything useful fits
+    capacity = rng.choice([scale * rng.randint(0, 25) + rng.randint(0, scale - 1), sum(weights) + 1])
+    weights = [w if rng.random() < 0.9 else capacity + rng.randint(1, 5) for w in weights]
+    return values, weights, capacity
+
+
+@pytest.mark.parametrize("method", ["dp", "numpy", "bitset"])
+def test_reduction_keeps_the_chosen_set(method):
+    rng = random.Random(0)
+    hit = {"scale": 0, "forced": 0, "free": 0, "dropped": 0}
+    for _ in range(500):
+        values, weights, capacity = random_instance(rng)
+        reduced = solve(values, weights, capacity, method=method)
+        plain = solve(values, weights, capacity, method=method, preprocess=False)
+        assert reduced.chosen == plain.chosen
+        assert reduced.total_value == plain.total_value
+
+        reduction = reduce_instance(values, weights, capacity)
+        hit["scale"] += reduction.scale > 1
+        hit["forced"] += bool(reduction.forced)
+        hit["free"] += any(w == 0 and v > 0 for v, w in zip(values, weights))
+        hit["dropped"] += any(w > capacity for w in weights)
+    # Every reduction path was exercised
+    assert all(hit.values()), hit
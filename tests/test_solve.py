@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from knapsack_solver import SOLVERS, SolveMetrics, SolveTimeout, choose_method, solve, solve_dp
+
+VALUES = [60, 100, 120, 30, 75]
+WEIGHTS = [10, 20, 30, 5, 25]
+CAPACITY = 50
+
+
+@pytest.mark.parametrize("preprocess", [True, False])
+def test_auto_accepts_options_of_any_mode(preprocess):
+    expected = solve_dp(VALUES, WEIGHTS, CAPACITY).total_value
+    for options in ({"time_limit": 10.0}, {"memory_budget": 1 << 20}, {"workers": 1, "epsilon": 0.5}):
+        result = solve(VALUES, WEIGHTS, CAPACITY, preprocess=preprocess, **options)
+        assert result.total_value == expected
+
+
+@pytest.mark.parametrize("method", sorted(set(SOLVERS) - {"fptas", "greedy"}))
+def test_time_limit_works_for_every_exact_mode(method):
+    result = solve(VALUES, WEIGHTS, CAPACITY, method=method, time_limit=10.0)
+    assert result.total_value == solve_dp(VALUES, WEIGHTS, CAPACITY).total_value
+
+
+def test_time_limit_stops_table_modes():
+    with pytest.raises(SolveTimeout):
+        solve(VALUES, WEIGHTS, CAPACITY, method="numpy", preprocess=False, time_limit=-1.0)
+
+
+def test_explicit_mode_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        solve(VALUES, WEIGHTS, CAPACITY, method="numpy", epsilon=0.5)
+
+
+def test_memory_budget_steers_auto_to_disk(tmp_path):
+    assert choose_method(VALUES, WEIGHTS, CAPACITY) != "memmap"
+    assert choose_method(VALUES, WEIGHTS, CAPACITY, memory_budget=8) == "memmap"
+    result = solve(VALUES, WEIGHTS, CAPACITY, preprocess=False, memory_budget=8, directory=str(tmp_path))
+    assert result.total_value == solve_dp(VALUES, WEIGHTS, CAPACITY).total_value
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_budget_moves_the_value_table_to_disk(tmp_path):
+    rng = random.Random(0)
+    values = [rng.randint(1, 50) for _ in range(400)]
+    weights = [rng.randint(10**5, 10**6) for _ in range(400)]
+    capacity = sum(weights) // 2
+    assert choose_method(values, weights, capacity, memory_budget=1 << 10) == "value"
+
+    in_memory = solve(values, weights, capacity, method="value")
+    metrics = SolveMetrics()
+    on_disk = solve(values, weights, capacity, memory_budget=1 << 10, directory=str(tmp_path), metrics=metrics)
+    assert on_disk.method == "value"
+    assert on_disk.chosen == in_memory.chosen
+    assert metrics.phases["table fill"]["peak_bytes"] <= (1 << 10) + 8 * (sum(values) + 1)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,43 @@
+import itertools
+import random
+
+import pytest
+
+from knapsack_solver import solve_dp, solve_top_k
+
+
+def brute_force_values(values, weights, capacity):
+    # Every feasible set of items that are worth something, most valuable first
+    useful = [i for i in range(len(values)) if values[i] > 0 and weights[i] <= capacity]
+    totals = []
+    for r in range(len(useful) + 1):
+        for subset in itertools.combinations(useful, r):
+            if sum(weights[i] for i in subset) <= capacity:
+                totals.append(sum(values[i] for i in subset))
+    return sorted(totals, reverse=True)
+
+
+@pytest.mark.parametrize("k", [1, 2, 5])
+def test_k_best_distinct_sets_in_order(k):
+    rng = random.Random(k)
+    for _ in range(300):
+        n = rng.randint(0, 9)
+        values = [rng.randint(-2, 20) for _ in range(n)]
+        weights = [rng.randint(0, 12) for _ in range(n)]
+        capacity = rng.randint(0, 40)
+        ranked = solve_top_k(values, weights, capacity, k=k)
+
+        assert [r.total_value for r in ranked] == brute_force_values(values, weights, capacity)[:k]
+        assert len({r.chosen for r in ranked}) == len(ranked)
+        assert ranked[0].chosen == solve_dp(values, weights, capacity).chosen
+        for r in ranked:
+            assert r.total_weight == sum(weights[i] for i in r.chosen) <= capacity
+            assert r.upper_bound == ranked[0].total_value
+            assert r.optimal == (r.total_value == ranked[0].total_value)
+
+
+def test_cell_limit():
+    with pytest.raises(ValueError):
+        solve_top_k([1, 2, 3], [1, 2, 3], 100, k=4, max_cells=100)
+    with pytest.raises(ValueError):
+        solve_top_k([1], [1], 1, k=0)